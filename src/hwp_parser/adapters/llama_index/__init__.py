@@ -26,6 +26,28 @@ Usage:
     )
 """
 
-from hwp_parser.adapters.llama_index.reader import HWPReader
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hwp_parser.adapters.llama_index.reader import HWPReader
+
+# Lazy import: llama-index-core는 무겁고 선택적 의존성이므로
+# 실제로 HWPReader를 사용할 때까지 import를 미룬다 (hwp_parser.__init__과 동일 패턴)
+_HWPReader = None
+
+
+def __getattr__(name: str):
+    """Lazy import for optional dependencies."""
+    global _HWPReader
+
+    if name == "HWPReader":
+        if _HWPReader is None:
+            from hwp_parser.adapters.llama_index.reader import HWPReader as _HWPReader
+        return _HWPReader
+
+    raise AttributeError(
+        f"module 'hwp_parser.adapters.llama_index' has no attribute '{name}'"
+    )
+
 
 __all__ = ["HWPReader"]
@@ -7,10 +7,17 @@ HWP 파일을 Document 객체로 변환합니다.
 
 from __future__ import annotations
 
-import base64
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
+# SIMD 가속 base64 (선택적). 미설치 시 stdlib으로 대체
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 # 런타임 import
 try:
     from llama_index.core.readers.base import BaseReader
@@ -62,12 +69,22 @@ class HWPReader(BaseReader):  # type: ignore[misc]
             Path("document.hwp"),
             extra_info={"category": "manual"}
         )
+
+        # 대량 인제스천용 고성능 모드 (Worker Pool)
+        with HWPReader(num_workers=4) as reader:
+            docs = reader.load_data(Path("document.hwp"))
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self, *args: Any, num_workers: int | None = None, **kwargs: Any
+    ) -> None:
         """
         HWPReader 초기화
 
+        Args:
+            num_workers: 워커 프로세스 수. None이면 subprocess 모드,
+                양수면 Persistent Worker Pool 모드 (HWPConverter와 동일).
+
         Raises:
             ImportError: llama-index-core가 설치되지 않은 경우
         """
@@ -78,7 +95,27 @@ class HWPReader(BaseReader):  # type: ignore[misc]
             )
 
         super().__init__(*args, **kwargs)
-        self._converter = HWPConverter()
+        self._converter = HWPConverter(num_workers=num_workers)
+
+        # 동일 파일 반복 로드(인제스천 루프) 대비 변환 결과 LRU 캐시.
+        # 키: (절대 경로, mtime_ns, size, 포맷) → 파일 변경 시 자동 무효화
+        self._cache: OrderedDict[
+            tuple[str, int, int, str], tuple[str, str, str, str]
+        ] = OrderedDict()
+        self._cache_max = 64
+
+    def close(self) -> None:
+        """워커 프로세스 정리 (subprocess 모드에서는 no-op)"""
+        self._converter._shutdown_workers()
+
+    def __enter__(self) -> "HWPReader":
+        """Context manager 진입 - 워커 자동 시작"""
+        self._converter.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager 종료 - 워커 자동 정리"""
+        self._converter.__exit__(exc_type, exc_val, exc_tb)
 
     def load_data(
         self,
@@ -107,26 +144,54 @@ class HWPReader(BaseReader):  # type: ignore[misc]
         if not isinstance(file, Path):
             file = Path(file)
 
-        # Core 변환기로 변환
-        result = self._converter.convert(file, output_format)
-
-        # HTML은 HTMLDirResult를 반환
-        if isinstance(result, HTMLDirResult):
-            content = result.xhtml_content
-            pipeline = "hwp→xhtml"
-        elif result.is_binary:
-            # ODT는 바이너리이므로 base64 인코딩
-            content = base64.b64encode(cast(bytes, result.content)).decode("utf-8")
-            pipeline = result.pipeline
+        # stat 기반 캐시 키 (stat 실패 시 캐시를 우회하고 변환기의 기존 예외 사용)
+        try:
+            st = file.stat()
+            cache_key = (
+                str(file.resolve()),
+                st.st_mtime_ns,
+                st.st_size,
+                output_format,
+            )
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            content, file_name, file_path_str, pipeline = self._cache[cache_key]
         else:
-            content = cast(str, result.content)
-            pipeline = result.pipeline
+            # Core 변환기로 변환
+            result = self._converter.convert(file, output_format)
+
+            # HTML은 HTMLDirResult를 반환
+            if isinstance(result, HTMLDirResult):
+                content = result.xhtml_content
+                pipeline = "hwp→xhtml"
+            elif result.is_binary:
+                # ODT는 바이너리이므로 base64 인코딩
+                content = b64encode(cast(bytes, result.content)).decode("ascii")
+                pipeline = result.pipeline
+            else:
+                content = cast(str, result.content)
+                pipeline = result.pipeline
+
+            file_name = result.source_name
+            # 이미 절대 경로면 getcwd() 호출 없이 그대로 사용
+            if result.source_path.is_absolute():
+                file_path_str = os.fspath(result.source_path)
+            else:
+                file_path_str = str(result.source_path.resolve())
+
+            if cache_key is not None:
+                self._cache[cache_key] = (content, file_name, file_path_str, pipeline)
+                if len(self._cache) > self._cache_max:
+                    self._cache.popitem(last=False)
 
         # 메타데이터 구성
         metadata: dict[str, Any] = {
-            "file_name": result.source_name,
-            "file_path": str(result.source_path.absolute()),
-            "format": result.output_format,
+            "file_name": file_name,
+            "file_path": file_path_str,
+            "format": output_format,
             "source": "hwp-parser",
             "conversion_pipeline": pipeline,
         }
@@ -3,6 +3,7 @@ HWP Parser CLI
 Click 기반의 커맨드라인 인터페이스
 """
 
+import fnmatch
 import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
@@ -13,6 +14,24 @@ import click
 from hwp_parser.core import HWPConverter
 from hwp_parser.core.converter import HTMLDirResult
 
+# 진행바 팩토리. 테스트에서 click 모듈 전체를 건드리지 않고
+# 이 속성만 교체할 수 있도록 모듈 레벨 간접 참조로 둔다.
+_progressbar = click.progressbar
+
+
+def _scan_names(directory: Path) -> list[str]:
+    """디렉터리의 파일 이름 목록을 한 번의 scandir로 수집
+
+    같은 디렉터리를 공유하는 여러 glob 패턴이 디렉터리를 반복해서 읽지
+    않도록 분리한 헬퍼. 존재하지 않는 디렉터리는 glob과 마찬가지로 빈
+    목록을 돌려준다.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
 
 def convert_file(
     file_path: Path, output_format: str, output_dir: Path | None, verbose: bool
@@ -140,27 +159,30 @@ def convert(
     """
     # 1. 대상 파일 수집 (Glob 패턴 처리)
     target_files: List[Path] = []
+    # 비재귀 패턴은 디렉터리별로 모아 디렉터리당 한 번의 scandir로 처리
+    glob_groups: dict[Path, list[str]] = {}
     for source in sources:
         # 쉘이 글로빙을 처리하지 않는 경우(예: 따옴표로 감쌈)를 위해 직접 glob 처리
         if "*" in source or "?" in source or "[" in source:
-            # 재귀 패턴(**)이 포함된 경우 rglob과 유사하게 처리하기 위해 pathlib 사용
-            # 하지만 단순함을 위해 현재 디렉토리 기준 glob이나 절대 경로 glob 사용
-            # pathlib의 glob은 재귀(**)를 지원함
-
-            # 입력이 경로를 포함하는지 확인
             p = Path(source)
-            if p.is_absolute():
-                base = p.root
-                pattern = str(p.relative_to(base))
-                found = list(Path(base).glob(pattern))
+            if "**" in source or any(ch in str(p.parent) for ch in "*?["):
+                # 재귀 패턴(**)이나 디렉터리 부분에 와일드카드가 있는 패턴
+                # (예: sub*/*.hwp)은 pathlib의 glob에 위임
+                if p.is_absolute():
+                    base = p.root
+                    pattern = str(p.relative_to(base))
+                    found = list(Path(base).glob(pattern))
+                else:
+                    found = list(Path(".").glob(source))
+
+                if not found:
+                    click.echo(
+                        f"Warning: 패턴 '{source}'에 매칭되는 파일이 없습니다.",
+                        err=True,
+                    )
+                target_files.extend(found)
             else:
-                found = list(Path(".").glob(source))
-
-            if not found:
-                click.echo(
-                    f"Warning: 패턴 '{source}'에 매칭되는 파일이 없습니다.", err=True
-                )
-            target_files.extend(found)
+                glob_groups.setdefault(p.parent, []).append(p.name)
         else:
             path = Path(source)
             if path.exists() and path.is_file():
@@ -171,6 +193,20 @@ def convert(
             else:
                 click.echo(f"Warning: 파일 '{source}'를 찾을 수 없습니다.", err=True)
 
+    # 같은 디렉터리를 공유하는 패턴들은 디렉터리를 한 번만 읽고
+    # 각 패턴을 fnmatch로 매칭
+    for directory, patterns in glob_groups.items():
+        names = _scan_names(directory)
+        for pattern in patterns:
+            # pathlib.Path.glob과 동일하게 숨김 파일도 매칭 대상
+            matched = fnmatch.filter(names, pattern)
+            if not matched:
+                click.echo(
+                    f"Warning: 패턴 '{directory / pattern}'에 매칭되는 파일이 없습니다.",
+                    err=True,
+                )
+            target_files.extend(directory / name for name in matched)
+
     # 중복 제거 및 정렬
     target_files = sorted(list(set(target_files)))
 
@@ -195,7 +231,7 @@ def convert(
         }
 
         # click.progressbar를 사용하여 진행률 표시
-        with click.progressbar(
+        with _progressbar(
             length=len(target_files), label="Converting", show_eta=True
         ) as bar:
             for future in as_completed(futures):
@@ -0,0 +1,103 @@
+"""
+pyhwp 인-프로세스 변환 백엔드
+
+subprocess 없이 pyhwp Python API를 직접 호출하는 공용 헬퍼입니다.
+HWPConverter의 기본(subprocess 모드) 경로와 Persistent Worker가
+같은 구현을 공유합니다. CLI(hwp5html/hwp5odt)를 파일마다 fork+exec로
+실행하면 CPython 기동과 hwp5/lxml import 비용을 매번 지불하므로,
+이미 import된 프로세스 안에서 변환하는 쪽이 작은 문서일수록 유리합니다.
+
+Note:
+    이 모듈은 pyhwp(AGPL v3)를 직접 import합니다.
+    따라서 이 라이브러리(hwp-parser)도 AGPL v3 라이선스가 적용됩니다.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+# pyhwp 직접 import (AGPL v3)
+from hwp5.hwp5html import HTMLTransform
+from hwp5.hwp5odt import ODTPackage, ODTTransform
+from hwp5.storage import is_storage
+from hwp5.xmlmodel import Hwp5File
+
+
+def convert_to_html_dir(file_path: Path) -> tuple[str, str, dict[str, bytes]]:
+    """HWP를 HTML 구조로 변환 (pyhwp 직접 호출, 인-메모리)
+
+    transform_hwp5_to_dir로 임시 디렉터리에 썼다가 다시 읽어 삭제하는
+    왕복 대신, XSLT 변환 결과를 BytesIO로 바로 받고 bindata도 BinData
+    스토리지에서 직접 읽습니다. 중간 xhwp5 XML만 pyhwp 내부에서 임시
+    파일을 사용합니다.
+
+    Returns:
+        tuple[xhtml_content, css_content, bindata]
+    """
+    hwp5file = Hwp5File(str(file_path))
+    try:
+        transform = HTMLTransform()
+        with transform.transformed_xhwp5_at_temp(hwp5file) as xhwp5path:
+            xhtml_buf = io.BytesIO()
+            transform.transform_xhwp5_to_xhtml(xhwp5path, xhtml_buf)
+            css_buf = io.BytesIO()
+            transform.transform_xhwp5_to_css(xhwp5path, css_buf)
+
+        # BinData 스토리지에서 바이너리 데이터 직접 추출
+        bindata: dict[str, bytes] = {}
+        if "BinData" in hwp5file:
+            bindata_stg = hwp5file["BinData"]
+            for name in bindata_stg:
+                item = bindata_stg[name]
+                # pyhwp는 BinData에 파일만 저장. 서브 스토리지 스킵은
+                # 미래 변경이나 비정상 문서에 대비한 방어 코드.
+                if is_storage(item):  # pragma: no cover
+                    continue
+                item_file = item.open()
+                try:
+                    # hwp5.storage.unpack과 동일한 파일명 정규화
+                    bindata[name.replace("\x05", "_05")] = item_file.read()
+                finally:
+                    item_file.close()
+    finally:
+        hwp5file.wrapped.close()
+
+    xhtml_content = xhtml_buf.getvalue().decode("utf-8")
+    if not xhtml_content:
+        raise RuntimeError(
+            f"HTML 변환 실패: 변환 결과가 비어 있음 - {file_path.name}"
+        )
+    css_content = css_buf.getvalue().decode("utf-8")
+
+    return xhtml_content, css_content, bindata
+
+
+def convert_to_odt(file_path: Path, temp_dir: Path) -> bytes:
+    """HWP를 ODT로 변환 (pyhwp 직접 호출)
+
+    hwp5odt CLI와 같은 ODTTransform/ODTPackage를 인-프로세스로 사용합니다.
+    CLI와 달리 RelaxNG 검증은 수행하지 않습니다 (검증 오류로 실패하던
+    복잡한 서식의 문서도 변환 결과를 그대로 반환).
+    """
+    output_file = temp_dir / f"{file_path.stem}.odt"
+
+    hwp5file = Hwp5File(str(file_path))
+    try:
+        transform = ODTTransform()
+        package = ODTPackage(str(output_file))
+        try:
+            transform.transform_hwp5_to_package(hwp5file, package)
+        except Exception as e:
+            raise RuntimeError(f"ODT 변환 실패: {file_path.name}\n{e}") from e
+        finally:
+            package.close()
+    finally:
+        hwp5file.wrapped.close()
+
+    if not output_file.exists():
+        raise RuntimeError(
+            f"ODT 변환 실패: 결과 파일이 생성되지 않음 - {file_path.name}"
+        )
+
+    return output_file.read_bytes()
@@ -6,10 +6,14 @@ pyhwp를 사용하여 HWP 파일을 다양한 포맷으로 변환합니다.
 
 from __future__ import annotations
 
+import functools
 import html
 import io
 import multiprocessing
+import os
+import re
 import shutil
+import stat as stat_module
 import subprocess
 import sys
 import tempfile
@@ -19,7 +23,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from multiprocessing import Process, Queue
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, cast
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 # Fork 경고 방지: spawn 모드 사용 (멀티스레드 환경에서 안전)
 try:
@@ -29,40 +43,290 @@ except RuntimeError:  # pragma: no cover
 
 from loguru import logger
 
+# C 기반 HTML 파서 (선택적). 미설치 시 html2text 경로만 사용
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
 if TYPE_CHECKING:
     from hwp_parser.core.worker import WorkerResult
 
 OutputFormat = Literal["txt", "html", "markdown", "odt"]
 
+# ConversionResult.content 타입 (텍스트 포맷은 str, ODT는 bytes)
+ContentT = TypeVar("ContentT", bound="str | bytes")
+
+# to_text에서 제거할 Markdown 이스케이프: \( \) \[ \] \. \* \_ \#
+_MD_UNESCAPE_RE = re.compile(r"\\([()\[\].*_#])")
+
+# to_markdown용 html_to_markdown 설정 (불변 설정 객체이므로 한 번만 생성)
+_MD_OPTIONS = None
+
+
+def _get_md_options():
+    """html_to_markdown ConversionOptions 싱글턴 반환 (lazy import)"""
+    global _MD_OPTIONS
+    if _MD_OPTIONS is None:
+        from html_to_markdown import ConversionOptions
+
+        _MD_OPTIONS = ConversionOptions(escape_misc=False)
+    return _MD_OPTIONS
+
+# 로거 설정은 프로세스당 한 번이면 충분 (모듈 전역 센티널)
+_LOGGER_CONFIGURED = False
+
+# pyhwp 인-프로세스 백엔드 (lazy import 캐시)
+# hwp5/lxml import는 무겁기 때문에 첫 변환 시점까지 미룬다
+_PYHWP_BACKEND_TRIED = False
+_pyhwp_backend = None
+
+
+def _load_pyhwp_backend():
+    """pyhwp 인-프로세스 백엔드를 lazy import (실패 시 None → CLI 폴백)"""
+    global _PYHWP_BACKEND_TRIED, _pyhwp_backend
+    if not _PYHWP_BACKEND_TRIED:
+        _PYHWP_BACKEND_TRIED = True
+        try:
+            from hwp_parser.core import _pyhwp_backend as backend
+        except ImportError:  # pragma: no cover
+            backend = None
+        _pyhwp_backend = backend
+    return _pyhwp_backend
+
+
+def _configure_logger() -> None:
+    """loguru 로거 설정 (멱등)"""
+    global _LOGGER_CONFIGURED
+    if _LOGGER_CONFIGURED:
+        return
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="INFO",
+        colorize=True,
+        format=(
+            "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+            "<level>{level: <8}</level> | {message}"
+        ),
+    )
+    _LOGGER_CONFIGURED = True
+
+
+def _scratch_root() -> str | None:
+    """변환 스크래치 디렉터리의 루트 경로 반환
+
+    HWPPARSER_SCRATCH_DIR 환경 변수가 있으면 그 경로를, 없으면 리눅스의
+    /dev/shm(램 파일시스템)을 사용합니다. 쓰고-바로-읽고-지우는 스크래치
+    출력이 디스크 write-back을 일으키지 않게 하기 위함입니다. 둘 다
+    불가하면 None을 반환해 tempfile 기본 경로를 따릅니다 (macOS의
+    $TMPDIR은 이미 램 기반).
+    """
+    override = os.environ.get("HWPPARSER_SCRATCH_DIR")
+    if override:
+        return override
+
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
+def _remove_dir_fast(path: Path) -> None:
+    """디렉터리를 재귀 삭제 (변환 스크래치 전용)
+
+    shutil.rmtree는 심링크 공격 방어를 위해 항목마다 lstat을 다시
+    호출합니다. 변환기가 직접 만든 스크래치 디렉터리에는 해당 위험이
+    없으므로 os.scandir의 DirEntry 타입 정보를 그대로 사용해 삭제합니다.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_dir_fast(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _stat_size(file_path: Path) -> int:
+    """파일 크기 반환 (stat 실패 시 0)"""
+    try:
+        return os.stat(file_path).st_size
+    except OSError:
+        return 0
+
+
+# 빠른 경로를 포기하게 만드는 요소들. 테이블/링크/이미지/코드 블록은 물론,
+# html2text가 마크업('# ...', '**...**')으로 렌더링하는 제목/강조 태그가
+# 있으면 단순 텍스트 추출과 출력이 달라지므로 기존 경로를 타야 합니다.
+_FAST_PATH_EXCLUDE_CSS = (
+    "table, a, img, pre, code, h1, h2, h3, h4, h5, h6, strong, b, em, i"
+)
+
+
+def _plain_text_fast_path(xhtml_content: str) -> str | None:
+    """서식 없는 XHTML에 대한 텍스트 추출 빠른 경로
+
+    문서에 _FAST_PATH_EXCLUDE_CSS에 해당하는 서식 요소가 없으면 html2text
+    상태 기계를 거칠 필요 없이 C 파서(selectolax)로 충분합니다.
+    selectolax 미설치이거나 서식이 있으면 None을 반환해 기존 경로를 따릅니다.
+
+    hwp5html은 한 구절을 여러 <span>으로 쪼개므로 body 전체에 텍스트 노드
+    단위 separator를 주면 구절 중간에서 줄이 바뀝니다. 인라인 텍스트는
+    <p> 블록 단위로 이어 붙이고, 블록 사이만 개행으로 구분합니다.
+    """
+    if _SelectolaxParser is None:
+        return None
+
+    tree = _SelectolaxParser(xhtml_content)
+    if tree.body is None or tree.css_first(_FAST_PATH_EXCLUDE_CSS) is not None:
+        return None
+
+    blocks = [p.text() for p in tree.css("p")]
+    # <p> 밖에 텍스트가 있는 구조(머리말 div 등)는 빠른 경로 포기
+    body_text = tree.body.text()
+    if "".join("".join(blocks).split()) != "".join(body_text.split()):
+        return None
+
+    # HTML 렌더링 의미론(html2text와 동일)대로 블록 내 연속 공백은 한 칸으로
+    normalized = (" ".join(block.split()) for block in blocks)
+    return "\n".join(block for block in normalized if block)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_bin(name: str) -> str:
+    """pyhwp CLI 실행 파일의 절대 경로를 프로세스당 한 번만 해석
+
+    subprocess.run에 명령 이름만 넘기면 호출마다 PATH 전체를 스캔하고,
+    미설치 시에는 모호한 FileNotFoundError가 발생합니다. shutil.which로
+    한 번 해석해 캐시하고, 없으면 명확한 RuntimeError를 발생시킵니다.
+    """
+    path = shutil.which(name)
+    if path is None:
+        raise RuntimeError(
+            f"{name} 명령을 찾을 수 없습니다. "
+            f"pyhwp가 설치되어 있는지 확인하세요: pip install pyhwp"
+        )
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _hwp5html_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[str, str, tuple[tuple[str, bytes], ...]]:
+    """hwp5html 변환 결과 캐시
+
+    to_text/to_markdown이 내부적으로 to_html을 다시 호출하므로, 같은
+    파일을 여러 포맷으로 변환할 때 HTML 변환이 반복 실행됩니다.
+    (경로, mtime_ns, 크기)를 키로 캐시하여 변경되지 않은 파일의 재변환을
+    생략합니다. 파일이 수정되면 mtime/크기가 달라져 자동으로 미스가 됩니다.
+
+    변환은 pyhwp 인-프로세스 백엔드를 우선 사용하고 (파일당 fork+exec와
+    인터프리터 기동 비용 제거), 백엔드를 import할 수 없을 때만
+    hwp5html CLI로 폴백합니다.
 
-@dataclass
-class ConversionResult:
+    Returns:
+        tuple[xhtml_content, css_content, bindata 항목 튜플]
+    """
+    del mtime_ns, size  # 캐시 키 전용
+    file_path = Path(path_str)
+    backend = _load_pyhwp_backend()
+
+    # 인-프로세스 경로 (변환 결과를 메모리로 직접 수신, 임시 디렉터리 불필요)
+    if backend is not None:
+        try:
+            xhtml_content, css_content, bindata = backend.convert_to_html_dir(
+                file_path
+            )
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"HTML 변환 실패: {file_path.name}\n{e}") from e
+        return xhtml_content, css_content, tuple(bindata.items())
+
+    # CLI 폴백 (정리는 TemporaryDirectory의 rmtree 대신 _remove_dir_fast)
+    temp_dir = tempfile.mkdtemp(dir=_scratch_root())
+    try:
+        output_dir = Path(temp_dir) / file_path.stem
+
+        command = [_resolve_bin("hwp5html"), f"--output={output_dir}", str(file_path)]
+        proc_result = subprocess.run(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        if proc_result.returncode != 0:
+            raise RuntimeError(
+                f"HTML 변환 실패: {file_path.name}\n{proc_result.stderr}"
+            )
+
+        xhtml_file = output_dir / "index.xhtml"
+        css_file = output_dir / "styles.css"
+
+        if not xhtml_file.exists():
+            raise RuntimeError(
+                f"HTML 변환 실패: 결과 파일이 생성되지 않음 - {file_path.name}"
+            )
+
+        # 바이트로 읽어 universal newline 처리를 생략 (hwp5html 출력은 UTF-8)
+        xhtml_content = xhtml_file.read_bytes().decode("utf-8")
+        css_content = (
+            css_file.read_bytes().decode("utf-8") if css_file.exists() else ""
+        )
+
+        # bindata 디렉터리 읽기 (scandir의 is_file()은 dirent 타입 비트를
+        # 사용하므로 iterdir+is_file처럼 항목마다 stat을 호출하지 않음)
+        bindata: dict[str, bytes] = {}
+        bindata_dir = output_dir / "bindata"
+        if bindata_dir.is_dir():
+            with os.scandir(bindata_dir) as entries:
+                for entry in entries:
+                    # pyhwp(hwp5html)는 bindata에 파일만 생성하고 서브디렉터리는 생성하지 않음.
+                    # is_file() 체크는 미래 변경이나 파일시스템 이상에 대비한 방어 코드.
+                    if entry.is_file():  # pragma: no branch
+                        with open(entry.path, "rb") as f:
+                            bindata[entry.name] = f.read()
+    finally:
+        _remove_dir_fast(Path(temp_dir))
+
+    return xhtml_content, css_content, tuple(bindata.items())
+
+
+@dataclass(slots=True)
+class ConversionResult(Generic[ContentT]):
     """
     HWP 변환 결과를 담는 데이터 클래스
 
+    포맷별 content 타입을 제네릭으로 표현합니다:
+    to_text/to_markdown은 ConversionResult[str], to_odt는
+    ConversionResult[bytes]를 반환하므로 호출부에서 cast 없이
+    content 타입이 확정됩니다.
+
     Attributes:
         content: 변환된 콘텐츠 (텍스트 또는 바이너리)
         source_path: 원본 HWP 파일 경로
         output_format: 변환된 포맷
         pipeline: 변환 파이프라인 설명
         converted_at: 변환 시각
+        source_name: 원본 파일 이름 (생성 시 계산)
+        is_binary: 바이너리 콘텐츠 여부 (생성 시 계산)
     """
 
-    content: str | bytes
+    content: ContentT
     source_path: Path
     output_format: OutputFormat
     pipeline: str
     converted_at: datetime = field(default_factory=datetime.now)
+    # 객체 수명 동안 불변이므로 property 대신 생성 시 한 번만 계산
+    source_name: str = field(init=False)
+    is_binary: bool = field(init=False)
 
-    @property
-    def source_name(self) -> str:
-        """원본 파일 이름"""
-        return self.source_path.name
-
-    @property
-    def is_binary(self) -> bool:
-        """바이너리 콘텐츠 여부"""
-        return isinstance(self.content, bytes)
+    def __post_init__(self) -> None:
+        self.source_name = self.source_path.name
+        self.is_binary = isinstance(self.content, bytes)
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -77,7 +341,7 @@ class ConversionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HTMLDirResult:
     """
     HTML 디렉터리 변환 결과를 담는 데이터 클래스
@@ -116,14 +380,27 @@ class HTMLDirResult:
         """원본 파일 이름"""
         return self.source_path.name
 
+    # to_zip_bytes에서 deflate를 적용할 bindata 확장자 (텍스트 계열).
+    # PNG/JPEG 등 이미 압축된 이미지는 deflate가 CPU만 쓰고 오히려 커짐.
+    _DEFLATE_SUFFIXES: ClassVar[tuple[str, ...]] = (".xml", ".txt", ".svg")
+
     def to_zip_bytes(self) -> bytes:
-        """결과를 ZIP 파일 바이트로 변환"""
+        """결과를 ZIP 파일 바이트로 변환
+
+        텍스트(xhtml/css 및 텍스트 계열 bindata)만 deflate로 압축하고,
+        이미 압축된 이미지 bindata는 ZIP_STORED로 그대로 담습니다.
+        """
         buffer = io.BytesIO()
         with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
             zf.writestr("index.xhtml", self.xhtml_content.encode("utf-8"))
             zf.writestr("styles.css", self.css_content.encode("utf-8"))
             for name, data in self.bindata.items():
-                zf.writestr(f"bindata/{name}", data)
+                compress = (
+                    zipfile.ZIP_DEFLATED
+                    if name.lower().endswith(self._DEFLATE_SUFFIXES)
+                    else zipfile.ZIP_STORED
+                )
+                zf.writestr(f"bindata/{name}", data, compress_type=compress)
         return buffer.getvalue()
 
     def get_preview_html(self) -> str:
@@ -150,9 +427,15 @@ class HTMLDirResult:
         # 2. CSS를 style 태그로 인라인 삽입
         css_tag = f"<style>\n{self.css_content}\n</style>"
 
-        # </head> 앞에 CSS 삽입
-        if "</head>" in html:
-            return html.replace("</head>", f"{css_tag}\n</head>")
+        # </head> 앞에 CSS 삽입. str.replace는 첫 매치 이후에도 문서 끝까지
+        # 스캔하므로, 항상 문서 앞부분에 있는 </head>는 범위를 제한한 find로
+        # 찾고 슬라이스 두 번으로 조립한다.
+        idx = html.find("</head>", 0, 8192)
+        if idx < 0:  # pragma: no cover
+            # head가 앞 8KB를 벗어난 비정상 문서는 전체 탐색으로 폴백
+            idx = html.find("</head>")
+        if idx >= 0:
+            return f"{html[:idx]}{css_tag}\n{html[idx:]}"
         else:  # pragma: no cover
             # head가 없으면 맨 앞에 추가 (pyhwp는 항상 head를 생성하므로 발생하지 않음)
             return f"{css_tag}\n{html}"
@@ -187,7 +470,29 @@ class HWPConverter:
     """
 
     SUPPORTED_FORMATS: tuple[OutputFormat, ...] = ("txt", "html", "markdown", "odt")
-    _logger_configured: bool = False
+
+    # convert()의 포맷별 디스패치 테이블 (호출마다 dict + bound method 4개를
+    # 새로 만들지 않도록 메서드 이름으로 클래스에 한 번만 정의)
+    _DISPATCH: ClassVar[dict[str, str]] = {
+        "txt": "to_text",
+        "html": "to_html",
+        "markdown": "to_markdown",
+        "odt": "to_odt",
+    }
+
+    # O(1) 멤버십 검증용 (에러 메시지에는 순서 있는 SUPPORTED_FORMATS 사용)
+    _SUPPORTED_SET: ClassVar[frozenset[str]] = frozenset(SUPPORTED_FORMATS)
+
+    # to_text에서 사용하는 html2text 설정 (한 곳에서 관리)
+    _HTML2TEXT_OPTIONS: dict[str, bool | int] = {
+        "ignore_links": False,
+        "ignore_images": True,
+        "ignore_emphasis": False,
+        "body_width": 0,
+        "unicode_snob": True,
+        "escape_snob": True,
+        "bypass_tables": False,
+    }
 
     def __init__(self, verbose: bool = False, num_workers: int | None = None) -> None:
         """
@@ -200,6 +505,9 @@ class HWPConverter:
         self.verbose = verbose
         self.num_workers = num_workers
 
+        # 워커 모드 여부는 생성 시 한 번만 판정 (호출마다 None/양수 재검사 방지)
+        self._worker_mode = num_workers is not None and num_workers > 0
+
         # Worker Pool 관련 상태
         self._workers: list[Process] = []
         self._input_queue: Queue | None = None
@@ -208,13 +516,13 @@ class HWPConverter:
         self._worker_started = False
 
         if self.verbose:
-            self._configure_logger()
+            _configure_logger()
 
     # ========== Worker Pool 관리 ==========
 
     def _start_workers(self) -> None:
         """워커 프로세스 시작 (내부 API)"""
-        if self._worker_started or self.num_workers is None or self.num_workers <= 0:
+        if self._worker_started or not self._worker_mode:
             return
 
         from hwp_parser.core.worker import worker_main
@@ -254,24 +562,50 @@ class HWPConverter:
         self._output_queue = None
         self._worker_started = False
 
-    def _convert_via_worker(
-        self, file_path: Path, output_format: OutputFormat
-    ) -> ConversionResult:
-        """워커를 통한 변환 (내부 API)"""
+    def _submit_worker_task(self, file_path: Path, output_format: OutputFormat) -> int:
+        """워커 큐에 작업 제출 후 task_id 반환 (내부 API)"""
         from hwp_parser.core.worker import WorkerTask
 
         if not self._worker_started:
             self._start_workers()
 
         self._task_counter += 1
+        # is_absolute()는 순수 문자열 검사이므로, 이미 절대 경로인 입력에
+        # 대해 absolute()가 호출하는 getcwd()+경로 결합을 생략
+        if file_path.is_absolute():
+            path_str = os.fspath(file_path)
+        else:
+            path_str = str(file_path.absolute())
         task = WorkerTask(
             task_id=self._task_counter,
-            file_path=str(file_path.absolute()),
+            file_path=path_str,
             output_format=output_format,
         )
         self._input_queue.put(task)  # type: ignore
+        return self._task_counter
 
-        result: WorkerResult = self._output_queue.get()  # type: ignore
+    def _materialize_worker_result(
+        self,
+        result: WorkerResult,
+        file_path: Path,
+        output_format: OutputFormat,
+    ) -> ConversionResult | HTMLDirResult:
+        """WorkerResult를 공개 결과 객체로 변환 (내부 API)"""
+        from hwp_parser.core.worker import unpack_html_result
+
+        if output_format == "html":
+            if not result.success:
+                raise RuntimeError(f"HTML 변환 실패: {result.error}")
+
+            # 큰 결과는 공유 메모리로 전달됨 (unpack이 세그먼트를 읽고 해제)
+            xhtml_content, css_content, bindata = unpack_html_result(result)
+
+            return HTMLDirResult(
+                xhtml_content=xhtml_content,
+                css_content=css_content,
+                bindata=bindata,
+                source_path=file_path,
+            )
 
         if not result.success:
             raise RuntimeError(f"변환 실패: {result.error}")
@@ -293,36 +627,71 @@ class HWPConverter:
             pipeline=pipeline,
         )
 
+    def _convert_via_worker(
+        self, file_path: Path, output_format: OutputFormat
+    ) -> ConversionResult:
+        """워커를 통한 변환 (내부 API)"""
+        self._submit_worker_task(file_path, output_format)
+        result: WorkerResult = self._output_queue.get()  # type: ignore
+        return cast(
+            "ConversionResult",
+            self._materialize_worker_result(result, file_path, output_format),
+        )
+
     def _convert_html_via_worker(self, file_path: Path) -> HTMLDirResult:
         """워커를 통한 HTML 디렉터리 변환 (내부 API)"""
-        from hwp_parser.core.worker import WorkerTask
-
-        if not self._worker_started:
-            self._start_workers()
-
-        self._task_counter += 1
-        task = WorkerTask(
-            task_id=self._task_counter,
-            file_path=str(file_path.absolute()),
-            output_format="html",
+        self._submit_worker_task(file_path, "html")
+        result: WorkerResult = self._output_queue.get()  # type: ignore
+        return cast(
+            "HTMLDirResult",
+            self._materialize_worker_result(result, file_path, "html"),
         )
-        self._input_queue.put(task)  # type: ignore
 
-        result: WorkerResult = self._output_queue.get()  # type: ignore
+    def _convert_many_via_worker(
+        self, paths: Iterable[Path], output_format: OutputFormat
+    ) -> Iterator[ConversionResult | HTMLDirResult]:
+        """여러 파일을 워커 풀에 일괄 제출 후 입력 순서대로 yield (내부 API)
 
-        if not result.success:
-            raise RuntimeError(f"HTML 변환 실패: {result.error}")
+        put/get을 1:1로 반복하면 호출자가 단일 스레드일 때 워커가 하나만
+        일하게 됩니다. 작업을 전부 제출한 뒤 task_id로 결과를 맞춰 입력
+        순서대로 반환하면 N개의 워커가 동시에 채워집니다.
+        """
+        validated = [self._validate_file(p) for p in paths]
 
-        return HTMLDirResult(
-            xhtml_content=cast("str", result.content),
-            css_content=result.css_content or "",
-            bindata=result.bindata or {},
-            source_path=file_path,
-        )
+        task_ids: list[int] = []
+        path_by_id: dict[int, Path] = {}
+        for file_path in validated:
+            task_id = self._submit_worker_task(file_path, output_format)
+            task_ids.append(task_id)
+            path_by_id[task_id] = file_path
+
+        received: dict[int, WorkerResult] = {}
+        fetched = 0
+        try:
+            for task_id in task_ids:
+                while task_id not in received:
+                    result: WorkerResult = self._output_queue.get()  # type: ignore
+                    received[result.task_id] = result
+                    fetched += 1
+                yield self._materialize_worker_result(
+                    received.pop(task_id), path_by_id.pop(task_id), output_format
+                )
+        finally:
+            # 조기 종료/실패 시 남은 결과를 비워 다음 호출과의 혼선 방지
+            # (공유 메모리로 도착한 결과는 unpack으로 세그먼트까지 해제)
+            from hwp_parser.core.worker import unpack_html_result
+
+            for leftover in received.values():
+                if leftover.shm_name is not None:  # pragma: no cover
+                    unpack_html_result(leftover)
+            for _ in range(len(task_ids) - fetched):
+                leftover = self._output_queue.get()  # type: ignore
+                if leftover.shm_name is not None:  # pragma: no cover
+                    unpack_html_result(leftover)
 
     def __enter__(self) -> "HWPConverter":
         """Context manager 진입 - 워커 자동 시작"""
-        if self.num_workers and self.num_workers > 0:
+        if self._worker_mode:
             self._start_workers()
         return self
 
@@ -332,32 +701,22 @@ class HWPConverter:
 
     # ========== 로깅 ==========
 
-    @classmethod
-    def _configure_logger(cls) -> None:
-        if cls._logger_configured:
-            return
-        logger.remove()
-        logger.add(
-            sys.stderr,
-            level="INFO",
-            colorize=True,
-            format=(
-                "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-                "<level>{level: <8}</level> | {message}"
-            ),
-        )
-        cls._logger_configured = True
+    def _log_start(self, file_path: Path, output_format: OutputFormat) -> int:
+        """변환 시작 로그 출력 후 입력 파일 크기 반환 (verbose가 아니면 0)
 
-    def _log_start(self, file_path: Path, output_format: OutputFormat) -> None:
+        반환값을 _log_finish의 input_size로 전달하면 stat 재호출을 생략합니다.
+        """
         if not self.verbose:
-            return
-        input_size = file_path.stat().st_size if file_path.exists() else 0
+            return 0
+        # exists() 선확인 없이 stat 한 번으로 처리 (_validate_file과 동일한 패턴)
+        input_size = _stat_size(file_path)
         logger.info(
             "HWP 변환 시작 | {name} | 입력 {size} bytes | 포맷 {fmt}",
             name=file_path.name,
             size=input_size,
             fmt=output_format,
         )
+        return input_size
 
     def _log_finish(
         self,
@@ -366,21 +725,26 @@ class HWPConverter:
         pipeline: str,
         content: str | bytes,
         started_at: float,
+        input_size: int | None = None,
     ) -> None:
         if not self.verbose:
             return
-        input_size = file_path.stat().st_size if file_path.exists() else 0
-        output_size = len(content)
         elapsed = time.perf_counter() - started_at
-        logger.info(
+        # lazy=True: INFO를 소비하는 sink가 없으면(런타임에 레벨을 올린 경우)
+        # stat/len 호출과 값 평가 자체가 생략됨
+        logger.opt(lazy=True).info(
             "HWP 변환 완료 | {name} | 입력 {in_size} bytes | 출력 {out_size} bytes | "
             "포맷 {fmt} | 파이프라인 {pipeline} | 소요 {elapsed:.3f}s",
-            name=file_path.name,
-            in_size=input_size,
-            out_size=output_size,
-            fmt=output_format,
-            pipeline=pipeline,
-            elapsed=elapsed,
+            name=lambda: file_path.name,
+            in_size=(
+                (lambda: input_size)
+                if input_size is not None
+                else (lambda: _stat_size(file_path))
+            ),
+            out_size=lambda: len(content),
+            fmt=lambda: output_format,
+            pipeline=lambda: pipeline,
+            elapsed=lambda: elapsed,
         )
 
     def _validate_file(self, file_path: Path) -> Path:
@@ -400,20 +764,74 @@ class HWPConverter:
         if not isinstance(file_path, Path):
             file_path = Path(file_path)
 
-        if file_path.is_dir():
+        # stat 한 번으로 존재 여부와 디렉토리 여부를 모두 확인
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+
+        if stat_module.S_ISDIR(st.st_mode):
             raise ValueError(
                 f"디렉토리가 입력되었습니다: {file_path}\n"
                 f"HWP 파일 경로를 지정해야 합니다."
             )
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-
         return file_path
 
     def _use_worker(self) -> bool:
-        """워커 모드 사용 여부 확인"""
-        return self.num_workers is not None and self.num_workers > 0
+        """워커 모드 사용 여부 확인 (__init__에서 판정된 값)"""
+        return self._worker_mode
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """hwp5html 변환 캐시 비우기"""
+        _hwp5html_cached.cache_clear()
+
+    @classmethod
+    def _new_html2text(cls):
+        """to_text용으로 설정된 html2text 인스턴스 생성
+
+        단일 인스턴스를 캐시해 재사용하는 방안은 HTML2Text가 handle()
+        호출 사이에 문서 상태(줄바꿈 토글, 테이블 카운터 등)를 유지해
+        다음 문서의 출력이 달라지므로 사용하지 않습니다.
+        """
+        import html2text
+
+        h = html2text.HTML2Text()
+        for name, value in cls._HTML2TEXT_OPTIONS.items():
+            setattr(h, name, value)
+        return h
+
+    def _xhtml_to_text(self, xhtml_content: str) -> str:
+        """XHTML 문자열을 순수 텍스트로 변환 (to_text의 2단계, 내부 API)
+
+        서식 없는 문서는 C 파서 빠른 경로를 사용하고 (엔티티 디코드 포함),
+        그 외에는 html2text 경로에서 엔티티 언이스케이프('&'가 없으면 생략)와
+        Markdown 이스케이프 제거를 수행합니다.
+        """
+        text_content = _plain_text_fast_path(xhtml_content)
+        if text_content is not None:
+            return text_content
+
+        text_content = self._new_html2text().handle(xhtml_content)
+        if "&" in text_content:
+            text_content = html.unescape(text_content)
+        return _MD_UNESCAPE_RE.sub(r"\1", text_content)
+
+    def _xhtml_to_markdown(self, xhtml_content: str) -> str:
+        """XHTML 문자열을 Markdown으로 변환 (to_markdown의 2단계, 내부 API)
+
+        html_to_markdown이 파싱 단계에서 엔티티를 디코드하므로 별도의
+        html.unescape 패스는 불필요합니다 (워커 경로와 동일).
+        """
+        try:
+            from html_to_markdown import convert
+        except ImportError:
+            raise ImportError(
+                "html-to-markdown 라이브러리가 필요합니다: pip install html-to-markdown"
+            )
+
+        return convert(xhtml_content, _get_md_options())
 
     def to_html(self, file_path: Path) -> HTMLDirResult:
         """
@@ -454,76 +872,36 @@ class HWPConverter:
                 )
             return result
 
-        # subprocess 모드
+        # subprocess 모드 (hwp5html 결과는 stat 키로 캐시됨)
         self._log_start(file_path, "html")
         started_at = time.perf_counter()
 
-        temp_dir = Path(tempfile.mkdtemp())
-        output_dir = temp_dir / file_path.stem
-
-        try:
-            command = ["hwp5html", f"--output={output_dir}", str(file_path)]
-            proc_result = subprocess.run(
-                command,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            if proc_result.returncode != 0:
-                raise RuntimeError(
-                    f"HTML 변환 실패: {file_path.name}\n{proc_result.stderr}"
-                )
-
-            xhtml_file = output_dir / "index.xhtml"
-            css_file = output_dir / "styles.css"
-
-            if not xhtml_file.exists():
-                raise RuntimeError(
-                    f"HTML 변환 실패: 결과 파일이 생성되지 않음 - {file_path.name}"
-                )
-
-            xhtml_content = xhtml_file.read_text(encoding="utf-8")
-            css_content = (
-                css_file.read_text(encoding="utf-8") if css_file.exists() else ""
-            )
+        st = file_path.stat()
+        xhtml_content, css_content, bindata_items = _hwp5html_cached(
+            str(file_path), st.st_mtime_ns, st.st_size
+        )
 
-            # bindata 디렉터리 읽기
-            bindata: dict[str, bytes] = {}
-            bindata_dir = output_dir / "bindata"
-            if bindata_dir.exists() and bindata_dir.is_dir():
-                for file in bindata_dir.iterdir():
-                    # pyhwp(hwp5html)는 bindata에 파일만 생성하고 서브디렉터리는 생성하지 않음.
-                    # is_file() 체크는 미래 변경이나 파일시스템 이상에 대비한 방어 코드.
-                    if file.is_file():  # pragma: no branch
-                        bindata[file.name] = file.read_bytes()
+        html_result = HTMLDirResult(
+            xhtml_content=xhtml_content,
+            css_content=css_content,
+            bindata=dict(bindata_items),
+            source_path=file_path,
+        )
 
-            html_result = HTMLDirResult(
-                xhtml_content=xhtml_content,
-                css_content=css_content,
-                bindata=bindata,
-                source_path=file_path,
+        elapsed = time.perf_counter() - started_at
+        if self.verbose:
+            logger.info(
+                "HTML 디렉터리 변환 완료 | {name} | xhtml={xhtml_size} css={css_size} bindata={bindata_count}개 | {elapsed:.3f}s",
+                name=file_path.name,
+                xhtml_size=len(xhtml_content),
+                css_size=len(css_content),
+                bindata_count=len(html_result.bindata),
+                elapsed=elapsed,
             )
 
-            elapsed = time.perf_counter() - started_at
-            if self.verbose:
-                logger.info(
-                    "HTML 디렉터리 변환 완료 | {name} | xhtml={xhtml_size} css={css_size} bindata={bindata_count}개 | {elapsed:.3f}s",
-                    name=file_path.name,
-                    xhtml_size=len(xhtml_content),
-                    css_size=len(css_content),
-                    bindata_count=len(bindata),
-                    elapsed=elapsed,
-                )
+        return html_result
 
-            return html_result
-
-        finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-
-    def to_text(self, file_path: Path) -> ConversionResult:
+    def to_text(self, file_path: Path) -> ConversionResult[str]:
         """
         HWP 파일을 순수 텍스트로 변환
 
@@ -544,43 +922,28 @@ class HWPConverter:
 
         # 워커 모드
         if self._use_worker():
-            self._log_start(file_path, "txt")
+            input_size = self._log_start(file_path, "txt")
             started_at = time.perf_counter()
             result = self._convert_via_worker(file_path, "txt")
             self._log_finish(
-                file_path, "txt", result.pipeline, result.content, started_at
+                file_path,
+                "txt",
+                result.pipeline,
+                result.content,
+                started_at,
+                input_size=input_size,
             )
             return result
 
         # subprocess 모드
-        import html2text
-
-        self._log_start(file_path, "txt")
+        input_size = self._log_start(file_path, "txt")
         started_at = time.perf_counter()
 
         # 1단계: HTML 변환
         html_result = self.to_html(file_path)
 
-        # 2단계: HTML → 텍스트
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = True
-        h.ignore_emphasis = False
-        h.body_width = 0
-        h.unicode_snob = True
-        h.escape_snob = True
-        h.bypass_tables = False
-
-        # to_html()은 HTMLDirResult를 반환
-        text_content = h.handle(html_result.xhtml_content)
-
-        # HTML 엔티티 언이스케이프
-        text_content = html.unescape(text_content)
-
-        # Markdown 이스케이프 제거
-        markdown_escapes = [r"\(", r"\)", r"\[", r"\]", r"\.", r"\*", r"\_", r"\#"]
-        for escape in markdown_escapes:
-            text_content = text_content.replace(escape, escape[1:])
+        # 2단계: HTML → 텍스트 (to_html()은 HTMLDirResult를 반환)
+        text_content = self._xhtml_to_text(html_result.xhtml_content)
 
         result = ConversionResult(
             content=text_content,
@@ -595,11 +958,12 @@ class HWPConverter:
             result.pipeline,
             result.content,
             started_at,
+            input_size=input_size,
         )
 
         return result
 
-    def to_markdown(self, file_path: Path) -> ConversionResult:
+    def to_markdown(self, file_path: Path) -> ConversionResult[str]:
         """
         HWP 파일을 Markdown으로 변환
 
@@ -621,32 +985,35 @@ class HWPConverter:
 
         # 워커 모드
         if self._use_worker():
-            self._log_start(file_path, "markdown")
+            input_size = self._log_start(file_path, "markdown")
             started_at = time.perf_counter()
             result = self._convert_via_worker(file_path, "markdown")
             self._log_finish(
-                file_path, "markdown", result.pipeline, result.content, started_at
+                file_path,
+                "markdown",
+                result.pipeline,
+                result.content,
+                started_at,
+                input_size=input_size,
             )
             return result
 
-        # subprocess 모드
+        # subprocess 모드 (HTML 변환 전에 html_to_markdown 가용성 확인)
         try:
-            from html_to_markdown import ConversionOptions, convert
+            import html_to_markdown  # noqa: F401
         except ImportError:
             raise ImportError(
                 "html-to-markdown 라이브러리가 필요합니다: pip install html-to-markdown"
             )
 
-        self._log_start(file_path, "markdown")
+        input_size = self._log_start(file_path, "markdown")
         started_at = time.perf_counter()
 
         # 1단계: HTML 변환
         html_result = self.to_html(file_path)
 
         # 2단계: HTML → Markdown (to_html()은 HTMLDirResult를 반환)
-        options = ConversionOptions(escape_misc=False)
-        markdown_content = convert(html_result.xhtml_content, options)
-        markdown_content = html.unescape(markdown_content)
+        markdown_content = self._xhtml_to_markdown(html_result.xhtml_content)
 
         result = ConversionResult(
             content=markdown_content,
@@ -661,17 +1028,20 @@ class HWPConverter:
             result.pipeline,
             result.content,
             started_at,
+            input_size=input_size,
         )
 
         return result
 
-    def to_odt(self, file_path: Path) -> ConversionResult:
+    def to_odt(self, file_path: Path) -> ConversionResult[bytes]:
         """
         HWP 파일을 ODT(Open Document Text)로 변환
 
-        pyhwp의 hwp5odt 명령을 사용합니다.
+        pyhwp의 ODT 변환기를 인-프로세스로 호출하며, 백엔드를 import할 수
+        없을 때만 hwp5odt 명령으로 폴백합니다.
 
-        ⚠️ 일부 복잡한 서식의 HWP는 RelaxNG 검증 오류가 발생할 수 있습니다.
+        ⚠️ CLI 폴백 경로에서는 일부 복잡한 서식의 HWP에서 RelaxNG 검증
+        오류가 발생할 수 있습니다.
 
         Args:
             file_path: 변환할 HWP 파일 경로
@@ -688,33 +1058,62 @@ class HWPConverter:
 
         # 워커 모드
         if self._use_worker():
-            self._log_start(file_path, "odt")
+            input_size = self._log_start(file_path, "odt")
             started_at = time.perf_counter()
             result = self._convert_via_worker(file_path, "odt")
             self._log_finish(
-                file_path, "odt", result.pipeline, result.content, started_at
+                file_path,
+                "odt",
+                result.pipeline,
+                result.content,
+                started_at,
+                input_size=input_size,
             )
             return result
 
-        # subprocess 모드
-        self._log_start(file_path, "odt")
+        # subprocess 모드 (인-프로세스 백엔드 우선, 실패 시 CLI 폴백)
+        input_size = self._log_start(file_path, "odt")
         started_at = time.perf_counter()
+        backend = _load_pyhwp_backend()
 
-        temp_dir = Path(tempfile.mkdtemp())
-        output_file = temp_dir / f"{file_path.stem}.odt"
-
+        temp_dir = tempfile.mkdtemp(dir=_scratch_root())
         try:
-            command = ["hwp5odt", f"--output={output_file}", str(file_path)]
-            result = subprocess.run(
+            output_file = Path(temp_dir) / f"{file_path.stem}.odt"
+
+            if backend is not None:
+                try:
+                    content = backend.convert_to_odt(file_path, Path(temp_dir))
+                except RuntimeError:
+                    raise
+                except Exception as e:
+                    raise RuntimeError(f"ODT 변환 실패: {file_path.name}\n{e}") from e
+                result = ConversionResult(
+                    content=content,
+                    source_path=file_path,
+                    output_format="odt",
+                    pipeline="hwp→odt",
+                )
+                self._log_finish(
+                    file_path,
+                    "odt",
+                    result.pipeline,
+                    result.content,
+                    started_at,
+                    input_size=input_size,
+                )
+                return result
+
+            command = [_resolve_bin("hwp5odt"), f"--output={output_file}", str(file_path)]
+            proc_result = subprocess.run(
                 command,
                 stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
             )
 
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
+            if proc_result.returncode != 0:
+                stderr = proc_result.stderr.strip()
                 if "RelaxNG" in stderr or "ValidationFailed" in stderr:
                     raise RuntimeError(
                         f"ODT 변환 실패 (RelaxNG 검증 오류): {file_path.name}\n"
@@ -729,27 +1128,26 @@ class HWPConverter:
                 )
 
             content = output_file.read_bytes()
+        finally:
+            _remove_dir_fast(Path(temp_dir))
 
-            result = ConversionResult(
-                content=content,
-                source_path=file_path,
-                output_format="odt",
-                pipeline="hwp→odt",
-            )
-
-            self._log_finish(
-                file_path,
-                "odt",
-                result.pipeline,
-                result.content,
-                started_at,
-            )
+        result = ConversionResult(
+            content=content,
+            source_path=file_path,
+            output_format="odt",
+            pipeline="hwp→odt",
+        )
 
-            return result
+        self._log_finish(
+            file_path,
+            "odt",
+            result.pipeline,
+            result.content,
+            started_at,
+            input_size=input_size,
+        )
 
-        finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+        return result
 
     def convert(
         self, file_path: Path, output_format: OutputFormat = "markdown"
@@ -767,17 +1165,178 @@ class HWPConverter:
         Raises:
             ValueError: 지원하지 않는 포맷인 경우
         """
-        if output_format not in self.SUPPORTED_FORMATS:
+        if output_format not in self._SUPPORTED_SET:
             raise ValueError(
                 f"지원하지 않는 포맷: {output_format}. "
                 f"사용 가능: {', '.join(self.SUPPORTED_FORMATS)}"
             )
 
-        converters = {
-            "txt": self.to_text,
-            "html": self.to_html,
-            "markdown": self.to_markdown,
-            "odt": self.to_odt,
-        }
+        return getattr(self, self._DISPATCH[output_format])(file_path)
+
+    def to_many(
+        self,
+        file_path: Path,
+        formats: Sequence[OutputFormat],
+    ) -> dict[OutputFormat, ConversionResult | HTMLDirResult]:
+        """
+        한 HWP 파일을 여러 포맷으로 한 번에 변환
+
+        txt/markdown은 내부적으로 같은 XHTML에서 파생되므로, 포맷별로
+        convert()를 반복 호출하는 대신 HTML 변환을 한 번만 수행하고
+        그 결과를 각 다운스트림 변환기에 공유합니다. odt는 XHTML을
+        거치지 않는 별도 파이프라인이라 개별 변환됩니다.
+
+        Args:
+            file_path: 변환할 HWP 파일 경로
+            formats: 출력 포맷 목록 (중복은 한 번만 변환)
+
+        Returns:
+            포맷별 변환 결과 딕셔너리
+
+        Raises:
+            ValueError: 지원하지 않는 포맷인 경우
+            FileNotFoundError: 파일이 존재하지 않는 경우
+            RuntimeError: 변환 실패
+
+        Example:
+            results = converter.to_many(path, ["txt", "markdown"])
+            print(results["txt"].content)
+        """
+        for output_format in formats:
+            if output_format not in self._SUPPORTED_SET:
+                raise ValueError(
+                    f"지원하지 않는 포맷: {output_format}. "
+                    f"사용 가능: {', '.join(self.SUPPORTED_FORMATS)}"
+                )
+
+        file_path = self._validate_file(file_path)
+
+        results: dict[OutputFormat, ConversionResult | HTMLDirResult] = {}
+        html_result: HTMLDirResult | None = None
+
+        for output_format in formats:
+            if output_format in results:
+                continue
+
+            if output_format == "odt":
+                results[output_format] = self.to_odt(file_path)
+                continue
+
+            # html/txt/markdown은 XHTML 하나를 공유 (HWP 파싱 1회)
+            if html_result is None:
+                html_result = self.to_html(file_path)
+
+            if output_format == "html":
+                results[output_format] = html_result
+            elif output_format == "txt":
+                results[output_format] = ConversionResult(
+                    content=self._xhtml_to_text(html_result.xhtml_content),
+                    source_path=file_path,
+                    output_format="txt",
+                    pipeline="hwp→xhtml→txt",
+                )
+            else:  # markdown
+                results[output_format] = ConversionResult(
+                    content=self._xhtml_to_markdown(html_result.xhtml_content),
+                    source_path=file_path,
+                    output_format="markdown",
+                    pipeline="hwp→xhtml→markdown",
+                )
+
+        return results
+
+    def convert_many(
+        self,
+        paths: Iterable[Path],
+        output_format: OutputFormat = "markdown",
+    ) -> Iterator[ConversionResult]:
+        """
+        여러 HWP 파일을 같은 포맷으로 변환 (lazy iterator, 입력 순서 유지)
+
+        Worker Pool 모드(num_workers>0)에서는 작업을 풀에 일괄 제출한 뒤
+        task_id로 결과를 입력 순서에 맞춰 반환하므로 N개의 워커가 동시에
+        변환을 진행합니다. subprocess 모드에서는 순차 변환하되 hwp5html
+        결과 캐시 덕분에 같은 파일의 반복 변환은 생략됩니다.
+
+        Args:
+            paths: 변환할 HWP 파일 경로들
+            output_format: 출력 포맷 (txt, html, markdown, odt)
+
+        Yields:
+            ConversionResult: 파일별 변환 결과 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 포맷인 경우
+
+        Example:
+            with HWPConverter(num_workers=4) as converter:
+                for result in converter.convert_many(hwp_files, "markdown"):
+                    print(result.source_name, len(result.content))
+        """
+        if output_format not in self._SUPPORTED_SET:
+            raise ValueError(
+                f"지원하지 않는 포맷: {output_format}. "
+                f"사용 가능: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+
+        # 워커 모드: 일괄 제출 + task_id 매칭으로 워커 풀 전체 활용
+        if self._use_worker():
+            yield from cast(
+                "Iterator[ConversionResult]",
+                self._convert_many_via_worker(paths, output_format),
+            )
+            return
+
+        for file_path in paths:
+            yield self.convert(file_path, output_format)
+
+    def convert_all(
+        self,
+        paths: Sequence[Path],
+        output_format: OutputFormat = "markdown",
+        max_workers: int | None = None,
+    ) -> Iterator[ConversionResult]:
+        """
+        여러 HWP 파일을 스레드 풀로 병렬 변환
+
+        기본 경로는 인-프로세스 pyhwp 백엔드이므로 순수 파이썬 구간은
+        GIL을 쥔 채 실행됩니다. 스레드 풀은 파일 I/O와 C 확장(zlib 등)
+        구간의 겹침만 기대할 수 있고, 백엔드 import 실패로 CLI
+        폴백(hwp5html/hwp5odt)을 타는 경우에만 외부 프로세스 덕에 코어
+        수만큼 스케일됩니다. CPU 바운드 대량 변환에는 Worker Pool
+        모드(num_workers>0)를 권장합니다. 결과는 완료 순서대로 yield됩니다.
+
+        Worker Pool 모드(num_workers>0)에서는 convert_many()의 일괄
+        제출 경로로 위임합니다 (워커 프로세스가 이미 병렬).
+
+        Args:
+            paths: 변환할 HWP 파일 경로들
+            output_format: 출력 포맷 (txt, html, markdown, odt)
+            max_workers: 동시 변환 스레드 수 (기본: CPU 코어 수)
+
+        Yields:
+            ConversionResult: 완료 순서대로의 변환 결과
+
+        Raises:
+            ValueError: 지원하지 않는 포맷인 경우
+        """
+        if output_format not in self._SUPPORTED_SET:
+            raise ValueError(
+                f"지원하지 않는 포맷: {output_format}. "
+                f"사용 가능: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+
+        # 워커 모드: convert_many가 일괄 제출로 풀 전체를 활용
+        if self._use_worker():
+            yield from self.convert_many(paths, output_format)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        return converters[output_format](file_path)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self.convert, file_path, output_format)
+                for file_path in paths
+            ]
+            for future in as_completed(futures):
+                yield future.result()
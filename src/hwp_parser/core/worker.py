@@ -4,29 +4,42 @@ Persistent Worker - pyhwp 직접 호출 워커
 subprocess 오버헤드 없이 pyhwp를 직접 사용하여 HWP 변환을 수행합니다.
 별도 프로세스에서 실행되며, 한 번 초기화 후 재사용됩니다.
 
+실제 변환 로직은 _pyhwp_backend 모듈에 있으며, HWPConverter의
+subprocess 모드와 공유됩니다.
+
 Note:
-    이 모듈은 pyhwp(AGPL v3)를 직접 import합니다.
+    이 모듈은 _pyhwp_backend를 통해 pyhwp(AGPL v3)를 직접 import합니다.
     따라서 이 라이브러리(hwp-parser)도 AGPL v3 라이선스가 적용됩니다.
 """
 
 from __future__ import annotations
 
-import shutil
-import subprocess
 import tempfile
 from dataclasses import dataclass
-from multiprocessing import Queue
+from multiprocessing import Queue, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Literal
+from typing import Literal, cast
+
+import html2text
+from html_to_markdown import convert as _md_convert
 
-# pyhwp 직접 import (AGPL v3)
-from hwp5.hwp5html import HTMLTransform
-from hwp5.xmlmodel import Hwp5File
+from hwp_parser.core._pyhwp_backend import (
+    convert_to_html_dir as _convert_to_html_dir,
+)
+from hwp_parser.core._pyhwp_backend import (
+    convert_to_odt as _convert_to_odt,
+)
+from hwp_parser.core.converter import _remove_dir_fast, _scratch_root
 
 OutputFormat = Literal["txt", "html", "markdown", "odt"]
 
+# 이 크기 이상의 HTML 결과는 Queue(pickle+파이프) 대신 공유 메모리로 전달.
+# 작은 결과는 SharedMemory 생성/mmap 비용이 pickle보다 비싸므로 인라인 유지.
+_SHM_MIN_BYTES = 256 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkerTask:
     """워커에게 전달되는 작업"""
 
@@ -35,7 +48,7 @@ class WorkerTask:
     output_format: OutputFormat
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerResult:
     """워커가 반환하는 결과"""
 
@@ -46,78 +59,95 @@ class WorkerResult:
     css_content: str | None = None
     bindata: dict[str, bytes] | None = None
     error: str | None = None
+    # 큰 HTML 결과의 공유 메모리 전달 (content/css_content/bindata 대신)
+    shm_name: str | None = None
+    shm_xhtml_size: int = 0
+    shm_css_size: int = 0
+    shm_bindata_sizes: tuple[tuple[str, int], ...] = ()
 
 
-def _convert_to_html_dir(
-    file_path: Path, temp_dir: Path
-) -> tuple[str, str, dict[str, bytes]]:
-    """HWP를 HTML 디렉터리 구조로 변환 (pyhwp 직접 호출)
+def _make_html_result(
+    task_id: int, xhtml: str, css: str, bindata: dict[str, bytes]
+) -> WorkerResult:
+    """HTML 변환 결과를 WorkerResult로 포장
 
-    Returns:
-        tuple[xhtml_content, css_content, bindata]
+    결과가 크면 전체 페이로드를 Queue로 pickle해 파이프를 왕복시키는 대신
+    공유 메모리 세그먼트에 담고 이름+오프셋만 전달합니다. 부모는
+    unpack_html_result()로 읽은 뒤 세그먼트를 해제합니다.
     """
-    output_dir = temp_dir / file_path.stem
-    output_dir.mkdir(parents=True, exist_ok=True)
+    xhtml_bytes = xhtml.encode("utf-8")
+    css_bytes = css.encode("utf-8")
+    total = len(xhtml_bytes) + len(css_bytes) + sum(len(d) for d in bindata.values())
+
+    if total < _SHM_MIN_BYTES:
+        return WorkerResult(
+            task_id=task_id,
+            success=True,
+            content=xhtml,
+            css_content=css,
+            bindata=bindata,
+        )
 
-    hwp5file = Hwp5File(str(file_path))
+    shm = SharedMemory(create=True, size=total)
     try:
-        transform = HTMLTransform()
-        transform.transform_hwp5_to_dir(hwp5file, str(output_dir))
-
-        xhtml_file = output_dir / "index.xhtml"
-        css_file = output_dir / "styles.css"
-
-        if not xhtml_file.exists():
-            raise RuntimeError(
-                f"HTML 변환 실패: 결과 파일이 생성되지 않음 - {file_path.name}"
-            )
-
-        xhtml_content = xhtml_file.read_text(encoding="utf-8")
-        css_content = css_file.read_text(encoding="utf-8") if css_file.exists() else ""
-
-        # bindata 디렉터리 읽기
-        bindata: dict[str, bytes] = {}
-        bindata_dir = output_dir / "bindata"
-        if bindata_dir.exists() and bindata_dir.is_dir():
-            for file in bindata_dir.iterdir():
-                # pyhwp(hwp5html)는 bindata에 파일만 생성하고 서브디렉터리는 생성하지 않음.
-                # is_file() 체크는 미래 변경이나 파일시스템 이상에 대비한 방어 코드.
-                if file.is_file():  # pragma: no branch
-                    bindata[file.name] = file.read_bytes()
-
-        return xhtml_content, css_content, bindata
+        offset = 0
+        for chunk in (xhtml_bytes, css_bytes, *bindata.values()):
+            shm.buf[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
     finally:
-        hwp5file.wrapped.close()
-
-
-def _convert_to_odt(file_path: Path, temp_dir: Path) -> bytes:
-    """HWP를 ODT로 변환 (hwp5odt CLI 사용 - 내부 API가 복잡하여 CLI 유지)"""
-    output_file = temp_dir / f"{file_path.stem}.odt"
+        shm.close()
 
-    command = ["hwp5odt", f"--output={output_file}", str(file_path)]
-    result = subprocess.run(
-        command,
-        stdin=subprocess.DEVNULL,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+    # 세그먼트 해제(unlink)는 부모 몫이므로 워커 쪽 resource_tracker 등록을
+    # 풀어 이중 정리 경고를 방지 (공개 API가 없어 내부 이름 사용)
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:  # pragma: no cover
+        pass
+
+    return WorkerResult(
+        task_id=task_id,
+        success=True,
+        shm_name=shm.name,
+        shm_xhtml_size=len(xhtml_bytes),
+        shm_css_size=len(css_bytes),
+        shm_bindata_sizes=tuple((name, len(d)) for name, d in bindata.items()),
     )
 
-    if result.returncode != 0:
-        raise RuntimeError(f"ODT 변환 실패: {file_path.name}\n{result.stderr}")
 
-    if not output_file.exists():
-        raise RuntimeError(
-            f"ODT 변환 실패: 결과 파일이 생성되지 않음 - {file_path.name}"
+def unpack_html_result(result: WorkerResult) -> tuple[str, str, dict[str, bytes]]:
+    """WorkerResult에서 (xhtml, css, bindata)를 복원
+
+    공유 메모리로 전달된 결과는 세그먼트를 읽은 뒤 close+unlink로
+    해제합니다. 인라인 결과는 필드를 그대로 반환합니다.
+    """
+    if result.shm_name is None:
+        return (
+            cast("str", result.content),
+            result.css_content or "",
+            result.bindata or {},
         )
 
-    return output_file.read_bytes()
+    shm = SharedMemory(name=result.shm_name)
+    try:
+        buf = shm.buf
+        offset = 0
+        xhtml = bytes(buf[offset : offset + result.shm_xhtml_size]).decode("utf-8")
+        offset += result.shm_xhtml_size
+        css = bytes(buf[offset : offset + result.shm_css_size]).decode("utf-8")
+        offset += result.shm_css_size
+
+        bindata: dict[str, bytes] = {}
+        for name, size in result.shm_bindata_sizes:
+            bindata[name] = bytes(buf[offset : offset + size])
+            offset += size
+        return xhtml, css, bindata
+    finally:
+        shm.close()
+        shm.unlink()
 
 
 def _html_to_text(html_content: str) -> str:
     """HTML을 텍스트로 변환"""
-    import html2text
-
     converter = html2text.HTML2Text()
     converter.ignore_links = True
     converter.ignore_images = True
@@ -129,9 +159,17 @@ def _html_to_text(html_content: str) -> str:
 
 def _html_to_markdown(html_content: str) -> str:
     """HTML을 Markdown으로 변환"""
-    from html_to_markdown import convert
+    return _md_convert(html_content).strip()
 
-    return convert(html_content).strip()
+
+def _worker_init() -> None:
+    """워커 프로세스 워밍업 (내부 API)
+
+    첫 실제 작업이 html2text/html_to_markdown의 내부 정규식 컴파일과
+    lazy 초기화 비용을 부담하지 않도록 작은 문서로 한 번씩 돌려 둡니다.
+    """
+    _html_to_text("<p>x</p>")
+    _html_to_markdown("<p>x</p>")
 
 
 def worker_main(input_queue: Queue, output_queue: Queue) -> None:
@@ -145,6 +183,21 @@ def worker_main(input_queue: Queue, output_queue: Queue) -> None:
         input_queue: 작업을 받는 큐
         output_queue: 결과를 전송하는 큐
     """
+    # 워커 수명 동안 재사용하는 스크래치 디렉터리.
+    # 작업마다 mkdtemp/rmtree를 반복하는 대신 하위 디렉터리만 만들고 비운다.
+    # 가능하면 램 파일시스템(/dev/shm)에 두어 디스크 write-back을 피한다.
+    _worker_init()
+    scratch = Path(tempfile.mkdtemp(prefix="hwpworker-", dir=_scratch_root()))
+
+    try:
+        _worker_loop(input_queue, output_queue, scratch)
+    finally:
+        if scratch.exists():
+            _remove_dir_fast(scratch)
+
+
+def _worker_loop(input_queue: Queue, output_queue: Queue, scratch: Path) -> None:
+    """worker_main의 작업 처리 루프 (내부 API)"""
     while True:
         task: WorkerTask | None = input_queue.get()
 
@@ -152,23 +205,18 @@ def worker_main(input_queue: Queue, output_queue: Queue) -> None:
         if task is None:
             break
 
-        temp_dir = Path(tempfile.mkdtemp())
+        # HTML 변환은 인-메모리로 수행되므로 임시 디렉터리는 ODT에서만 필요
+        temp_dir: Path | None = None
         try:
             file_path = Path(task.file_path)
 
             if task.output_format == "html":
-                xhtml, css, bindata = _convert_to_html_dir(file_path, temp_dir)
+                xhtml, css, bindata = _convert_to_html_dir(file_path)
                 output_queue.put(
-                    WorkerResult(
-                        task_id=task.task_id,
-                        success=True,
-                        content=xhtml,
-                        css_content=css,
-                        bindata=bindata,
-                    )
+                    _make_html_result(task.task_id, xhtml, css, bindata)
                 )
             elif task.output_format == "txt":
-                xhtml, _, _ = _convert_to_html_dir(file_path, temp_dir)
+                xhtml, _, _ = _convert_to_html_dir(file_path)
                 content = _html_to_text(xhtml)
                 output_queue.put(
                     WorkerResult(
@@ -178,7 +226,7 @@ def worker_main(input_queue: Queue, output_queue: Queue) -> None:
                     )
                 )
             elif task.output_format == "markdown":
-                xhtml, _, _ = _convert_to_html_dir(file_path, temp_dir)
+                xhtml, _, _ = _convert_to_html_dir(file_path)
                 content = _html_to_markdown(xhtml)
                 output_queue.put(
                     WorkerResult(
@@ -188,6 +236,8 @@ def worker_main(input_queue: Queue, output_queue: Queue) -> None:
                     )
                 )
             elif task.output_format == "odt":
+                temp_dir = scratch / f"task_{task.task_id}"
+                temp_dir.mkdir()
                 content = _convert_to_odt(file_path, temp_dir)
                 output_queue.put(
                     WorkerResult(
@@ -209,5 +259,5 @@ def worker_main(input_queue: Queue, output_queue: Queue) -> None:
             )
 
         finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            if temp_dir is not None and temp_dir.exists():
+                _remove_dir_fast(temp_dir)
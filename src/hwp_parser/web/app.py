@@ -2,16 +2,59 @@
 HWP Parser Web Demo (Gradio)
 """
 
+import hashlib
 import shutil
 import tempfile
+import threading
 import base64
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import gradio as gr
 
 from hwp_parser.core import HWPConverter
 
+# 동일 파일 재업로드 시 pyhwp 파이프라인 재실행을 피하기 위한
+# 콘텐츠 해시 기반 LRU 캐시. 키: (blake2b 해시, 포맷)
+_CACHE_MAX = 128
+_conversion_cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _file_digest(path: Path) -> str | None:
+    """파일 콘텐츠의 blake2b 해시 계산 (읽기 실패 시 None → 캐시 우회)"""
+    try:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(32768), b""):
+                h.update(chunk)
+        return h.hexdigest()
+    except OSError:
+        return None
+
+
+def _convert_cached(
+    convert_fn: Callable[[Path], Any], input_hwp: Path, digest: str | None, fmt: str
+) -> Any:
+    """해시 키로 변환 결과를 캐시하여 동일 파일 재변환을 생략"""
+    if digest is None:
+        return convert_fn(input_hwp)
+
+    key = (digest, fmt)
+    with _cache_lock:
+        if key in _conversion_cache:
+            _conversion_cache.move_to_end(key)
+            return _conversion_cache[key]
+
+    result = convert_fn(input_hwp)
+
+    with _cache_lock:
+        _conversion_cache[key] = result
+        if len(_conversion_cache) > _CACHE_MAX:
+            _conversion_cache.popitem(last=False)
+    return result
+
 
 def save_to_temp(content, filename, is_binary=False):
     """일반 임시 디렉터리에 파일을 저장하여 Gradio가 접근 가능하게 함"""
@@ -56,6 +99,7 @@ def convert(file_obj, formats):
             input_hwp = src_path
 
         converter = HWPConverter()
+        digest = _file_digest(input_hwp)
 
         # 결과 저장소
         # [md_view, md_file, html_preview, html_zip, txt_view, txt_file, odt_file, odt_status]
@@ -64,7 +108,7 @@ def convert(file_obj, formats):
         # 1. Markdown
         if "markdown" in formats:
             try:
-                res = converter.to_markdown(input_hwp)
+                res = _convert_cached(converter.to_markdown, input_hwp, digest, "markdown")
                 results[0] = res.content
                 results[1] = save_to_temp(res.content, f"{base_stem}.md")
             except Exception as e:
@@ -73,7 +117,7 @@ def convert(file_obj, formats):
         # 2. HTML (디렉터리 변환 사용)
         if "html" in formats:
             try:
-                html_res = converter.to_html(input_hwp)
+                html_res = _convert_cached(converter.to_html, input_hwp, digest, "html")
 
                 # 미리보기용 HTML (CSS, 이미지 인라인) - IFrame 격리 렌더링
                 preview_html = html_res.get_preview_html()
@@ -103,7 +147,7 @@ def convert(file_obj, formats):
         # 3. Text
         if "txt" in formats:
             try:
-                res = converter.to_text(input_hwp)
+                res = _convert_cached(converter.to_text, input_hwp, digest, "txt")
                 results[4] = res.content
                 results[5] = save_to_temp(res.content, f"{base_stem}.txt")
             except Exception as e:
@@ -112,7 +156,7 @@ def convert(file_obj, formats):
         # 4. ODT (바이너리)
         if "odt" in formats:
             try:
-                res = converter.to_odt(input_hwp)
+                res = _convert_cached(converter.to_odt, input_hwp, digest, "odt")
                 results[6] = save_to_temp(
                     res.content, f"{base_stem}.odt", is_binary=True
                 )
@@ -21,11 +21,12 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import uuid
+from http.client import HTTPConnection, HTTPException
 from pathlib import Path
 from typing import Callable
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
 
 import pytest
 
@@ -33,6 +34,15 @@ from hwp_parser.adapters.llama_index import HWPReader
 from hwp_parser.core import HWPConverter
 
 
+def _convert_one_text(file_path: Path) -> str:
+    """프로세스 풀 워커용 단일 파일 텍스트 변환 (모듈 레벨 - pickle 가능)
+
+    워커 프로세스마다 새 HWPConverter를 만들어 인스턴스 pickle 문제를
+    피합니다.
+    """
+    return HWPConverter().to_text(file_path).output_format
+
+
 def _format_bytes(size: int) -> str:
     for unit in ("B", "KB", "MB", "GB"):
         if size < 1024 or unit == "GB":
@@ -42,23 +52,20 @@ def _format_bytes(size: int) -> str:
 
 
 @pytest.fixture(scope="session", autouse=True)
-def _report_benchmark_samples() -> None:
-    """벤치마크 샘플 파일 크기 요약 출력."""
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    all_hwp_files = list(fixtures_dir.glob("*.hwp"))
-    if not all_hwp_files:
+def _report_benchmark_samples(_hwp_index: list[tuple[Path, int]]) -> None:
+    """벤치마크 샘플 파일 크기 요약 출력 (세션 인덱스 재사용)."""
+    if not _hwp_index:
         return
-    smallest = min(all_hwp_files, key=lambda f: f.stat().st_size)
-    largest = max(all_hwp_files, key=lambda f: f.stat().st_size)
-    small_hwp_files = sorted(all_hwp_files, key=lambda f: f.stat().st_size)[:3]
-    bulk_sizes = [f.stat().st_size for f in small_hwp_files]
+    smallest, smallest_size = _hwp_index[0]
+    largest, largest_size = _hwp_index[-1]
+    bulk_sizes = [size for _, size in _hwp_index[:3]]
     print(
         "\n".join(
             [
                 "Benchmark samples:",
-                f"- smallest: {smallest.name} ({_format_bytes(smallest.stat().st_size)})",
-                f"- largest: {largest.name} ({_format_bytes(largest.stat().st_size)})",
-                f"- bulk files: {len(small_hwp_files)} ({', '.join(_format_bytes(s) for s in bulk_sizes)})",
+                f"- smallest: {smallest.name} ({_format_bytes(smallest_size)})",
+                f"- largest: {largest.name} ({_format_bytes(largest_size)})",
+                f"- bulk files: {len(bulk_sizes)} ({', '.join(_format_bytes(s) for s in bulk_sizes)})",
             ]
         )
     )
@@ -68,11 +75,6 @@ def _report_benchmark_samples() -> None:
 class TestConverterBenchmark:
     """HWPConverter 벤치마크"""
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        """HWPConverter 인스턴스"""
-        return HWPConverter()
-
     def test_benchmark_to_html(
         self,
         benchmark: Callable,
@@ -117,11 +119,6 @@ class TestConverterBenchmark:
 class TestMultiFileBenchmark:
     """여러 파일 변환 벤치마크"""
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        """HWPConverter 인스턴스"""
-        return HWPConverter()
-
     def test_benchmark_batch_text_conversion(
         self,
         benchmark: Callable,
@@ -150,15 +147,34 @@ class TestMultiFileBenchmark:
         results = benchmark(convert_all)
         assert len(results) == len(small_hwp_files)
 
+    @pytest.mark.parametrize("max_workers", [1, 2, 4, os.cpu_count()])
+    def test_benchmark_batch_text_parallel(
+        self,
+        benchmark: Callable,
+        converter: HWPConverter,
+        small_hwp_files: list[Path],
+        max_workers: int,
+    ) -> None:
+        """스레드 풀 병렬 배치 변환 벤치마크 (워커 수 스케일링 측정)
+
+        기본 경로는 인-프로세스 pyhwp이므로 스레드 풀은 I/O·C 확장
+        구간의 겹침만 기대할 수 있습니다 (완전한 GIL 해제는 CLI 폴백
+        한정). 순차 배치 벤치마크와 비교하면 이 경로에서 워커 수가
+        실제로 얼마나 스케일하는지 볼 수 있습니다.
+        """
+
+        def convert_parallel() -> list:
+            return list(
+                converter.convert_all(small_hwp_files, "txt", max_workers=max_workers)
+            )
+
+        results = benchmark(convert_parallel)
+        assert len(results) == len(small_hwp_files)
+
 
 class TestPipelineBenchmark:
     """변환 파이프라인별 벤치마크"""
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        """HWPConverter 인스턴스"""
-        return HWPConverter()
-
     @pytest.mark.parametrize(
         "output_format,expected_pipeline",
         [
@@ -184,16 +200,6 @@ class TestPipelineBenchmark:
 class TestLargeFileBenchmark:
     """큰 파일 변환 벤치마크"""
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        """HWPConverter 인스턴스"""
-        return HWPConverter()
-
-    @pytest.fixture
-    def large_hwp_file(self, all_hwp_files: list[Path]) -> Path:
-        """가장 큰 HWP 파일"""
-        return max(all_hwp_files, key=lambda f: f.stat().st_size)
-
     def test_benchmark_large_file_to_text(
         self,
         benchmark: Callable,
@@ -201,7 +207,11 @@ class TestLargeFileBenchmark:
         large_hwp_file: Path,
     ) -> None:
         """큰 파일 텍스트 변환 벤치마크"""
-        result = benchmark(converter.to_text, large_hwp_file)
+        # 느린 변환은 auto-calibration 대신 pedantic으로 라운드 수를 고정
+        result = benchmark.pedantic(
+            converter.to_text, args=(large_hwp_file,),
+            warmup_rounds=1, rounds=5, iterations=1,
+        )
         assert result.output_format == "txt"
 
     def test_benchmark_large_file_to_markdown(
@@ -211,20 +221,85 @@ class TestLargeFileBenchmark:
         large_hwp_file: Path,
     ) -> None:
         """큰 파일 Markdown 변환 벤치마크"""
-        result = benchmark(converter.to_markdown, large_hwp_file)
+        result = benchmark.pedantic(
+            converter.to_markdown, args=(large_hwp_file,),
+            warmup_rounds=1, rounds=5, iterations=1,
+        )
         assert result.output_format == "markdown"
 
+    @pytest.mark.parametrize("copies", [os.cpu_count() or 2, 2 * (os.cpu_count() or 2)])
+    def test_benchmark_large_file_multiprocess(
+        self,
+        benchmark: Callable,
+        large_hwp_file: Path,
+        copies: int,
+    ) -> None:
+        """프로세스 풀 병렬 큰 파일 변환 벤치마크
+
+        CPU 바운드(순수 파이썬 XML 워킹) 구간은 스레드로는 GIL 때문에
+        병렬화되지 않으므로, 같은 큰 파일 N부를 ProcessPoolExecutor로
+        나눠 코어 수 대비 스케일링을 측정합니다.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        files = [large_hwp_file] * copies
+        max_workers = max((os.cpu_count() or 2) - 1, 1)
+
+        def convert_multiprocess() -> list[str]:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(_convert_one_text, files))
+
+        results = benchmark.pedantic(
+            convert_multiprocess, warmup_rounds=1, rounds=5, iterations=1
+        )
+        assert results == ["txt"] * copies
+
+
+class TestStageBenchmark:
+    """변환 단계별 진단 벤치마크
+
+    hwp→xhtml 단계를 fixture에서 미리 수행해 두고 xhtml→txt/markdown
+    다운스트림 단계만 따로 측정합니다. 전체 파이프라인 벤치마크와
+    비교하면 각 단계의 비중과 다운스트림 최적화 여지를 볼 수 있습니다.
+    """
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def sample_xhtml(converter: HWPConverter, sample_hwp_file: Path) -> str:
+        """미리 변환해 둔 XHTML (단계 분리 측정용)"""
+        return converter.to_html(sample_hwp_file).xhtml_content
+
+    def test_benchmark_xhtml_to_text_stage(
+        self,
+        benchmark: Callable,
+        converter: HWPConverter,
+        sample_xhtml: str,
+    ) -> None:
+        """XHTML → 텍스트 단계 벤치마크"""
+        result = benchmark(converter._xhtml_to_text, sample_xhtml)
+        assert isinstance(result, str)
+
+    def test_benchmark_xhtml_to_markdown_stage(
+        self,
+        benchmark: Callable,
+        converter: HWPConverter,
+        sample_xhtml: str,
+    ) -> None:
+        """XHTML → Markdown 단계 벤치마크"""
+        result = benchmark(converter._xhtml_to_markdown, sample_xhtml)
+        assert isinstance(result, str)
+
 
 @pytest.fixture
-def small_hwp_file(all_hwp_files: list[Path]) -> Path:
+def small_hwp_file(_hwp_index: list[tuple[Path, int]]) -> Path:
     """가장 작은 HWP 파일"""
-    return min(all_hwp_files, key=lambda f: f.stat().st_size)
+    return _hwp_index[0][0]
 
 
 @pytest.fixture
-def large_hwp_file(all_hwp_files: list[Path]) -> Path:
+def large_hwp_file(_hwp_index: list[tuple[Path, int]]) -> Path:
     """가장 큰 HWP 파일"""
-    return max(all_hwp_files, key=lambda f: f.stat().st_size)
+    return _hwp_index[-1][0]
 
 
 @pytest.fixture
@@ -233,11 +308,81 @@ def bulk_hwp_files(small_hwp_files: list[Path]) -> list[Path]:
     return small_hwp_files
 
 
+@pytest.fixture(scope="session")
+def matrix_file_lists(
+    _hwp_index: list[tuple[Path, int]],
+) -> dict[tuple[str, str], list[Path]]:
+    """(count, size) 조합별 파일 목록 (세션당 1회 구성)
+
+    function 스코프 fixture는 pytest-benchmark 셋업마다 다시 평가되므로
+    매트릭스 조합 4종을 미리 만들어 둡니다.
+    """
+    small = _hwp_index[0][0]
+    large = _hwp_index[-1][0]
+    bulk = [path for path, _ in _hwp_index[:3]]
+    return {
+        ("single", "small"): [small],
+        ("single", "large"): [large],
+        ("bulk", "small"): bulk,
+        ("bulk", "large"): [large] * len(bulk),
+    }
+
+
 # === 에지 케이스 ===
-def _post_hwp(url: str, file_path: Path) -> dict:
-    boundary = uuid.uuid4().hex
+# 멀티파트 본문 스트리밍 조각 크기
+_MULTIPART_CHUNK = 64 * 1024
+
+# 멀티파트 경계 문자열. 요청마다 고유할 필요가 없으므로 (본문과 겹치지만
+# 않으면 됨) 라운드마다 uuid4의 엔트로피 읽기를 반복하지 않고 한 번만 생성
+_BOUNDARY = "----hwpbench" + uuid.uuid4().hex
+
+
+def _multipart_body(header: bytes, file_path: Path, footer: bytes):
+    """멀티파트 본문을 조각 단위로 생성 (내부 API)
+
+    header + 파일 전체 + footer를 하나의 bytes로 연결하면 파일 크기만큼
+    피크 메모리가 두 배가 되고 소켓 전송 전에 memcpy로 멈춥니다.
+    generator로 넘기면 urllib이 조각을 받는 대로 소켓에 흘립니다.
+    """
+    yield header
+    with open(file_path, "rb") as fp:
+        while chunk := fp.read(_MULTIPART_CHUNK):
+            yield chunk
+    yield footer
+
+
+# netloc별 keep-alive HTTP 연결 (urlopen의 요청당 TCP 핸드셰이크 제거)
+# HTTPConnection은 스레드 안전하지 않으므로 스레드별로 캐시
+_HTTP_CONNECTIONS = threading.local()
+
+
+def _get_http_connection(netloc: str, timeout: float) -> HTTPConnection:
+    """netloc별 keep-alive 연결 반환 (벤치마크 라운드 간 재사용)"""
+    by_netloc: dict[str, HTTPConnection] | None = getattr(
+        _HTTP_CONNECTIONS, "by_netloc", None
+    )
+    if by_netloc is None:
+        by_netloc = _HTTP_CONNECTIONS.by_netloc = {}
+
+    conn = by_netloc.get(netloc)
+    if conn is None:
+        conn = HTTPConnection(netloc, timeout=timeout)
+        by_netloc[netloc] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _post_hwp_raw(url: str, file_path: Path) -> bytes:
+    """HWP 업로드 후 응답 바이트 반환 (JSON 디코드 없음)
+
+    벤치마크 측정 구간에는 이 함수를 넣어 HTTP 왕복만 측정하고,
+    JSON 파싱은 측정 밖에서 수행합니다.
+    """
+    boundary = _BOUNDARY
     mime = "application/octet-stream"
-    file_bytes = file_path.read_bytes()
 
     header = (
         f"--{boundary}\r\n"
@@ -245,36 +390,50 @@ def _post_hwp(url: str, file_path: Path) -> dict:
         f"Content-Type: {mime}\r\n\r\n"
     ).encode("utf-8")
     footer = f"\r\n--{boundary}--\r\n".encode("utf-8")
-    body = header + file_bytes + footer
 
-    request = Request(url, data=body, method="POST")
-    request.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
-    request.add_header("Content-Length", str(len(body)))
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        # Content-Length를 미리 계산해 chunked 인코딩 없이 스트리밍
+        "Content-Length": str(len(header) + file_path.stat().st_size + len(footer)),
+    }
 
-    with urlopen(request, timeout=30) as response:
-        payload = response.read().decode("utf-8")
-    return json.loads(payload)
+    parts = urlsplit(url)
+    conn = _get_http_connection(parts.netloc, timeout=30)
+    try:
+        conn.request(
+            "POST", parts.path, body=_multipart_body(header, file_path, footer),
+            headers=headers,
+        )
+        payload = conn.getresponse().read()
+    except (HTTPException, OSError):
+        # 서버가 keep-alive 연결을 닫은 경우 새 연결로 1회 재시도
+        conn.close()
+        conn.request(
+            "POST", parts.path, body=_multipart_body(header, file_path, footer),
+            headers=headers,
+        )
+        payload = conn.getresponse().read()
+    return payload
 
 
 def _rest_api_available(api_url: str) -> bool:
-    health_url = api_url.replace("/convert/markdown", "/health")
+    parts = urlsplit(api_url)
+    health_path = parts.path.replace("/convert/markdown", "/health")
     try:
         # BentoML API는 기본적으로 POST 메서드를 사용합니다.
         # GET 요청 시 405 Method Not Allowed가 발생할 수 있습니다.
-        req = Request(health_url, method="POST")
-        with urlopen(req, timeout=2) as response:
-            return response.status == 200
-    except URLError:
+        conn = _get_http_connection(parts.netloc, timeout=2)
+        conn.request("POST", health_path)
+        response = conn.getresponse()
+        response.read()  # keep-alive 유지를 위해 응답 본문 소비
+        return response.status == 200
+    except (HTTPException, OSError):
         return False
 
 
 class TestInterfaceBenchmark:
     """인터페이스별 처리 시간 벤치마크"""
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        return HWPConverter()
-
     def test_python_api_latency(
         self,
         benchmark: Callable,
@@ -307,20 +466,54 @@ class TestInterfaceBenchmark:
         if not _rest_api_available(api_url):
             pytest.skip("REST API 서버가 실행 중이 아닙니다.")
 
-        response = benchmark(_post_hwp, api_url, sample_hwp_file)
+        # 측정 구간은 HTTP 왕복만 포함, JSON 디코드는 검증용으로 측정 밖에서
+        payload = benchmark.pedantic(
+            _post_hwp_raw, args=(api_url, sample_hwp_file),
+            warmup_rounds=1, rounds=5, iterations=1,
+        )
+        response = json.loads(payload.decode("utf-8"))
         assert response.get("output_format") == "markdown"
 
+    @pytest.mark.parametrize("concurrency", [1, 4, 16])
+    def test_rest_api_throughput_concurrent(
+        self,
+        benchmark: Callable,
+        sample_hwp_file: Path,
+        concurrency: int,
+    ) -> None:
+        """REST API 동시 요청 처리량
 
-class TestInterfaceMatrixBenchmark:
-    """파일 크기/파일 수/인터페이스 조합 벤치마크"""
+        직렬 지연 시간과 별개로, N개의 동시 업로드로 서버 처리량 한계를
+        측정합니다. keep-alive 연결은 스레드별로 캐시되므로 첫 라운드
+        이후에는 핸드셰이크 비용 없이 정상 상태 처리량이 측정됩니다.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        api_url = os.environ.get(
+            "HWP_BENCHMARK_API_URL", "http://localhost:3000/convert/markdown"
+        )
+        if not _rest_api_available(api_url):
+            pytest.skip("REST API 서버가 실행 중이 아닙니다.")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+
+            def fire_all() -> list[bytes]:
+                return list(
+                    pool.map(
+                        lambda _: _post_hwp_raw(api_url, sample_hwp_file),
+                        range(concurrency),
+                    )
+                )
+
+            payloads = benchmark(fire_all)
 
-    @pytest.fixture
-    def converter(self) -> HWPConverter:
-        return HWPConverter()
+        responses = [json.loads(p.decode("utf-8")) for p in payloads]
+        assert len(responses) == concurrency
+        assert all(r.get("output_format") == "markdown" for r in responses)
 
-    @pytest.fixture
-    def reader(self) -> HWPReader:
-        return HWPReader()
+
+class TestInterfaceMatrixBenchmark:
+    """파일 크기/파일 수/인터페이스 조합 벤치마크"""
 
     @pytest.mark.parametrize("interface", ["python", "llama", "rest"])
     @pytest.mark.parametrize("count", ["single", "bulk"])
@@ -330,21 +523,13 @@ class TestInterfaceMatrixBenchmark:
         benchmark: Callable,
         converter: HWPConverter,
         reader: HWPReader,
-        small_hwp_file: Path,
-        large_hwp_file: Path,
-        bulk_hwp_files: list[Path],
+        matrix_file_lists: dict[tuple[str, str], list[Path]],
         interface: str,
         count: str,
         size: str,
     ) -> None:
         """조합별 처리 시간 측정"""
-        if count == "single":
-            file_list = [small_hwp_file if size == "small" else large_hwp_file]
-        else:
-            if size == "small":
-                file_list = bulk_hwp_files
-            else:
-                file_list = [large_hwp_file for _ in bulk_hwp_files]
+        file_list = matrix_file_lists[(count, size)]
 
         if interface == "python":
 
@@ -374,9 +559,10 @@ class TestInterfaceMatrixBenchmark:
         if not _rest_api_available(api_url):
             pytest.skip("REST API 서버가 실행 중이 아닙니다.")
 
-        def _run() -> list[dict]:
-            return [_post_hwp(api_url, f) for f in file_list]
+        def _run() -> list[bytes]:
+            return [_post_hwp_raw(api_url, f) for f in file_list]
 
-        responses = benchmark(_run)
+        payloads = benchmark(_run)
+        responses = [json.loads(p.decode("utf-8")) for p in payloads]
         assert len(responses) == len(file_list)
         assert all(r.get("output_format") == "markdown" for r in responses)
@@ -4,6 +4,7 @@ pytest 공통 fixtures
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -14,13 +15,25 @@ from hwp_parser.core import HWPConverter
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def converter() -> HWPConverter:
-    """HWPConverter 인스턴스"""
+    """HWPConverter 인스턴스 (세션 공유)
+
+    기본 인스턴스는 상태가 없으므로 테스트마다 새로 만들 필요가 없습니다.
+    verbose나 num_workers가 필요한 테스트는 직접 생성합니다.
+    """
     return HWPConverter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def reader():
+    """LlamaIndex HWPReader 인스턴스 (세션 공유)"""
+    from hwp_parser.adapters.llama_index import HWPReader
+
+    return HWPReader()
+
+
+@pytest.fixture(scope="session")
 def sample_hwp_file() -> Path:
     """샘플 HWP 파일 (가장 작은 파일)"""
     return FIXTURES_DIR / "_5_문서상태아이콘_ori.hwp"
@@ -32,18 +45,33 @@ def hwp_file_with_bindata() -> Path:
     return FIXTURES_DIR / "_4_문서정보구분[대외문서_협조문_내부기안_보안문서]_ori.hwp"
 
 
+@pytest.fixture(scope="session")
+def _hwp_index() -> list[tuple[Path, int]]:
+    """HWP fixture 파일의 (경로, 크기) 목록 (크기 오름차순)
+
+    glob + 파일별 stat을 fixture마다 반복하는 대신 세션당 한 번만
+    디렉터리를 스캔합니다. scandir의 stat은 dirent 캐시를 활용합니다.
+    """
+    with os.scandir(FIXTURES_DIR) as entries:
+        index = [
+            (Path(entry.path), entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith(".hwp")
+        ]
+    index.sort(key=lambda item: item[1])
+    return index
+
+
 @pytest.fixture
-def all_hwp_files() -> list[Path]:
-    """모든 HWP fixture 파일"""
-    return list(FIXTURES_DIR.glob("*.hwp"))
+def all_hwp_files(_hwp_index: list[tuple[Path, int]]) -> list[Path]:
+    """모든 HWP fixture 파일 (크기 오름차순)"""
+    return [path for path, _ in _hwp_index]
 
 
 @pytest.fixture
-def small_hwp_files() -> list[Path]:
-    """작은 HWP 파일들 (빠른 테스트용)"""
-    files = list(FIXTURES_DIR.glob("*.hwp"))
-    # 파일 크기 기준 정렬 후 상위 3개
-    return sorted(files, key=lambda f: f.stat().st_size)[:3]
+def small_hwp_files(_hwp_index: list[tuple[Path, int]]) -> list[Path]:
+    """작은 HWP 파일들 (빠른 테스트용, 크기 기준 상위 3개)"""
+    return [path for path, _ in _hwp_index[:3]]
 
 
 @pytest.fixture
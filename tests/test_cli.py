@@ -1,13 +1,171 @@
 """CLI 테스트."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
+import click
+import pytest
 from click.testing import CliRunner
 
+import hwp_parser.cli.app as app
+from hwp_parser.cli import main as cli_main
 from hwp_parser.cli.app import cli, convert_file, main
 
 
+@contextmanager
+def swap(module, name, value):
+    """mock.patch 대신 쓰는 가벼운 속성 교체 컨텍스트 매니저
+
+    mock.patch는 start/stop마다 임포트 경로 해석과 Mock 생성 비용이
+    들지만, 이미 임포트된 모듈 객체에 대한 setattr 교체는 수십 ns면
+    충분합니다. 핫한 CLI 테스트에서 반복되는 교체는 이쪽을 사용합니다.
+    """
+    old = getattr(module, name)
+    setattr(module, name, value)
+    try:
+        yield value
+    finally:
+        setattr(module, name, old)
+
+
+class FakeFuture:
+    """정해진 결과만 반환하는 Future 대역"""
+
+    def __init__(self, result: str) -> None:
+        self._result = result
+
+    def result(self) -> str:
+        return self._result
+
+
+class FakeExecutor:
+    """ProcessPoolExecutor 대역
+
+    MagicMock 체인 대신 쓰는 일반 클래스. 생성 인자와 submit 호출을
+    기록하고 모든 submit에 같은 FakeFuture를 돌려줍니다. 실제
+    프로세스는 생성되지 않으므로 동기적으로 실행되는 것처럼 동작합니다.
+    """
+
+    def __init__(self, result: str = "[Success]") -> None:
+        self.future = FakeFuture(result)
+        self.init_kwargs: dict | None = None
+        self.submit_calls: list[tuple] = []
+
+    def __call__(self, *args, **kwargs) -> "FakeExecutor":
+        # 프로덕션 코드의 ProcessPoolExecutor(max_workers=...) 호출 지점
+        self.init_kwargs = kwargs
+        return self
+
+    def __enter__(self) -> "FakeExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def submit(self, fn, *args) -> FakeFuture:
+        self.submit_calls.append((fn, *args))
+        return self.future
+
+
+def _as_completed_fake(futures):
+    """as_completed 대역 - 제출된 future를 제출 순서대로 순회"""
+    return list(futures)
+
+
+def _run_cli(args: list[str]) -> None:
+    """CliRunner 없이 Click 명령을 직접 실행
+
+    CliRunner.invoke는 호출마다 stdout/stderr/stdin 교체와 예외 래핑을
+    수행합니다. exit code와 출력 부분 문자열만 확인하는 단위 테스트는
+    standalone_mode=False로 명령 객체를 직접 호출하고 출력은 capsys로
+    캡처합니다. isolated_filesystem()이 필요한 테스트만 CliRunner를
+    유지합니다.
+    """
+    cli.main(args, prog_name="cli", standalone_mode=False)
+
+
+@pytest.fixture(scope="module")
+def fake_executor_factory():
+    """FakeExecutor 생성 팩토리 (모듈 공유)
+
+    테스트마다 팩토리 함수를 새로 정의하는 대신 모듈당 한 번만 만들어
+    공유합니다. FakeExecutor 인스턴스 자체는 호출 기록을 담는 상태가
+    있으므로 팩토리가 테스트마다 새 인스턴스를 돌려줍니다.
+    """
+
+    def factory(result: str = "[Success]") -> FakeExecutor:
+        return FakeExecutor(result)
+
+    return factory
+
+
+@pytest.fixture
+def cli_mock_env(fake_executor_factory):
+    """표준 CLI mock 환경 (runner + Executor/as_completed 교체 적용)
+
+    Executor 교체 블록이 테스트마다 복사되던 것을 하나의 fixture로
+    모았습니다. 기본 결과("[Success]")가 맞지 않는 테스트는
+    fake.future를 원하는 FakeFuture로 바꿔 끼웁니다.
+    """
+    runner = CliRunner()
+    fake = fake_executor_factory()
+    with (
+        swap(app, "ProcessPoolExecutor", fake),
+        swap(app, "as_completed", _as_completed_fake),
+    ):
+        yield runner, fake
+
+
+class FakeConverter:
+    """HWPConverter 대역
+
+    호출된 변환 메서드 이름을 기록하고, 지정된 결과를 반환하거나
+    예외를 던집니다.
+    """
+
+    def __init__(self, result=None, error: Exception | None = None) -> None:
+        self.result = result
+        self.error = error
+        self.calls: list[str] = []
+
+    def _convert(self, name: str):
+        self.calls.append(name)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def to_markdown(self, file_path):
+        return self._convert("to_markdown")
+
+    def to_html(self, file_path):
+        return self._convert("to_html")
+
+    def to_text(self, file_path):
+        return self._convert("to_text")
+
+    def to_odt(self, file_path):
+        return self._convert("to_odt")
+
+
+class FakeProgressBar:
+    """click.progressbar 대역"""
+
+    def __init__(self, is_hidden: bool) -> None:
+        self.is_hidden = is_hidden
+        self.updates: list[int] = []
+
+    def __enter__(self) -> "FakeProgressBar":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def update(self, n: int) -> None:
+        self.updates.append(n)
+
+
 class TestCli:
     """CLI 기능 테스트."""
 
@@ -30,121 +188,112 @@ class TestCli:
             assert result.exit_code == 0
             assert "변환할 파일이 없습니다." in result.output
 
-    def test_convert_command_single_file(self) -> None:
-        """단일 파일 변환 명령 실행 검증 (Mock 사용)."""
-        runner = CliRunner()
+    def test_convert_command_single_file(self, cli_mock_env) -> None:
+        """단일 파일 변환 명령 실행 검증 (Fake 사용)."""
+        # 주의: ProcessPoolExecutor 내부에서는 교체가 적용되지 않을 수 있음 (Pickling 문제)
+        # 따라서 Executor 자체를 대역으로 바꿔 동기적으로 실행되는 것처럼 흉내냄
+        runner, fake = cli_mock_env
+        fake.future = FakeFuture("[Success] test.hwp -> test.md")
         with runner.isolated_filesystem():
             # 가상 파일 생성
             with open("test.hwp", "w") as f:
                 f.write("dummy content")
 
-            # convert_file 함수 Mocking (실제 변환 방지)
-            # 주의: ProcessPoolExecutor 내부에서는 patch가 적용되지 않을 수 있음 (Pickling 문제)
-            # 따라서 ProcessPoolExecutor 자체를 Mocking하여 동기적으로 실행되는 것처럼 흉내냄
-            with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-                # Executor 컨텍스트 매니저 Mock
-                mock_pool = MagicMock()
-                mock_executor.return_value.__enter__.return_value = mock_pool
-
-                # submit 결과(Future) Mock
-                mock_future = MagicMock()
-                mock_future.result.return_value = "[Success] test.hwp -> test.md"
-
-                # as_completed가 generator이므로 future 리스트를 반환하도록 설정
-                # mock_executor를 사용했으므로 submit은 호출되지만 실제 스레드/프로세스는 생성안됨
-                # 따라서 as_completed도 굳이 진짜를 쓸 필요 없음
-                with patch(
-                    "hwp_parser.cli.app.as_completed", return_value=[mock_future]
-                ):
-                    # verbose 옵션을 켜야 성공 메시지가 출력됨
-                    result = runner.invoke(
-                        cli, ["convert", "test.hwp", "--workers", "1", "--verbose"]
-                    )
-
-                    assert result.exit_code == 0
-                    assert "총 1개의 파일을 변환합니다" in result.output
-                    assert "[Success] test.hwp -> test.md" in result.output
-
-    def test_convert_command_output_dir(self) -> None:
+            # verbose 옵션을 켜야 성공 메시지가 출력됨
+            result = runner.invoke(
+                cli, ["convert", "test.hwp", "--workers", "1", "--verbose"]
+            )
+
+            assert result.exit_code == 0
+            assert "총 1개의 파일을 변환합니다" in result.output
+            assert "[Success] test.hwp -> test.md" in result.output
+
+    def test_convert_command_output_dir(self, cli_mock_env) -> None:
         """출력 디렉터리 지정 옵션 검증."""
-        runner = CliRunner()
+        runner, fake = cli_mock_env
         with runner.isolated_filesystem():
             with open("test.hwp", "w") as f:
                 f.write("dummy")
 
-            with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-                mock_pool = MagicMock()
-                mock_executor.return_value.__enter__.return_value = mock_pool
-
-                mock_future = MagicMock()
-                mock_future.result.return_value = "Success"
-
-                with patch(
-                    "hwp_parser.cli.app.as_completed", return_value=[mock_future]
-                ):
-                    result = runner.invoke(
-                        cli, ["convert", "test.hwp", "--output-dir", "out"]
-                    )
+            result = runner.invoke(cli, ["convert", "test.hwp", "--output-dir", "out"])
 
-                    assert result.exit_code == 0
+            assert result.exit_code == 0
 
-                    # submit 호출 인자 확인 (output_dir은 4번째 인자)
-                    # submit(convert_file, f, format, output_path_obj, verbose)
-                    args = mock_pool.submit.call_args[0]
-                    assert args[3] == Path("out")
+            # submit 호출 인자 확인 (output_dir은 4번째 인자)
+            # submit(convert_file, f, format, output_path_obj, verbose)
+            args = fake.submit_calls[-1]
+            assert args[3] == Path("out")
 
-    def test_convert_command_format(self) -> None:
+    def test_convert_command_format(self, cli_mock_env) -> None:
         """변환 포맷 지정 옵션 검증."""
-        runner = CliRunner()
+        runner, fake = cli_mock_env
         with runner.isolated_filesystem():
             with open("test.hwp", "w") as f:
                 f.write("dummy")
 
-            with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-                mock_pool = MagicMock()
-                mock_executor.return_value.__enter__.return_value = mock_pool
+            result = runner.invoke(cli, ["convert", "test.hwp", "--format", "html"])
+
+            assert result.exit_code == 0
+
+            # submit 호출 인자 확인 (format은 3번째 인자)
+            args = fake.submit_calls[-1]
+            assert args[2] == "html"
+
+    def test_convert_submits_all_files_upfront(self, cli_mock_env) -> None:
+        """모든 파일이 결과 수거 전에 일괄 submit되는지 검증
+
+        파일을 하나씩 제출-수거하면 나머지 워커가 놀게 되므로, convert
+        명령은 전체 파일을 먼저 제출해 두고 as_completed로 결과를
+        수거해야 합니다. 이 순서가 회귀하지 않도록 이벤트 순서를
+        기록해 확인합니다.
+        """
+        runner, fake = cli_mock_env
+        events: list[str] = []
+
+        class RecordingFuture(FakeFuture):
+            def result(self) -> str:
+                events.append("result")
+                return super().result()
+
+        def recording_submit(fn, *args) -> RecordingFuture:
+            events.append("submit")
+            fake.submit_calls.append((fn, *args))
+            # 파일마다 별도 future를 돌려줘야 futures dict에서 합쳐지지 않음
+            return RecordingFuture("[Success]")
 
-                mock_future = MagicMock()
-                mock_future.result.return_value = "Success"
+        fake.submit = recording_submit
 
-                with patch(
-                    "hwp_parser.cli.app.as_completed", return_value=[mock_future]
-                ):
-                    result = runner.invoke(
-                        cli, ["convert", "test.hwp", "--format", "html"]
-                    )
+        with runner.isolated_filesystem():
+            for name in ("a.hwp", "b.hwp", "c.hwp"):
+                Path(name).touch()
 
-                    assert result.exit_code == 0
+            result = runner.invoke(cli, ["convert", "*.hwp", "--workers", "2"])
 
-                    # submit 호출 인자 확인 (format은 3번째 인자)
-                    args = mock_pool.submit.call_args[0]
-                    assert args[2] == "html"
+            assert result.exit_code == 0
+            assert events == ["submit"] * 3 + ["result"] * 3
 
 
 class TestConvertFileFunction:
     """convert_file 함수 단위 테스트."""
 
-    @patch("hwp_parser.cli.app.HWPConverter")
-    def test_convert_file_success(self, mock_converter_cls, tmp_path) -> None:
+    def test_convert_file_success(self, tmp_path) -> None:
         """convert_file 함수 정상 동작 테스트."""
-        # 1. Mock 설정
-        mock_instance = mock_converter_cls.return_value
-        mock_result = MagicMock()
-        mock_result.is_binary = False
-        mock_result.content = "Converted Content"
-        mock_instance.to_markdown.return_value = mock_result
+        # 1. Fake 설정 (결과 객체는 속성만 있으면 되므로 SimpleNamespace 사용)
+        mock_result = SimpleNamespace(is_binary=False, content="Converted Content")
+        fake = FakeConverter(result=mock_result)
 
         # 2. 파일 준비
         input_file = tmp_path / "doc.hwp"
         input_file.touch()
 
         # 3. 함수 실행
-        result_msg = convert_file(
-            file_path=input_file,
-            output_format="markdown",
-            output_dir=None,
-            verbose=False,
-        )
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
+            result_msg = convert_file(
+                file_path=input_file,
+                output_format="markdown",
+                output_dir=None,
+                verbose=False,
+            )
 
         # 4. 검증
         output_file = tmp_path / "doc.md"
@@ -152,25 +301,25 @@ class TestConvertFileFunction:
         assert output_file.read_text() == "Converted Content"
         assert "[Success]" in result_msg
         assert str(input_file.name) in result_msg
+        assert fake.calls == ["to_markdown"]
 
-    @patch("hwp_parser.cli.app.HWPConverter")
-    def test_convert_file_error(self, mock_converter_cls, tmp_path) -> None:
+    def test_convert_file_error(self, tmp_path) -> None:
         """변환 중 에러 발생 시 처리 검증."""
-        # 1. Mock 설정 (예외 발생)
-        mock_instance = mock_converter_cls.return_value
-        mock_instance.to_markdown.side_effect = Exception("Conversion Failed")
+        # 1. Fake 설정 (예외 발생)
+        fake = FakeConverter(error=Exception("Conversion Failed"))
 
         # 2. 파일 준비
         input_file = tmp_path / "error.hwp"
         input_file.touch()
 
         # 3. 함수 실행
-        result_msg = convert_file(
-            file_path=input_file,
-            output_format="markdown",
-            output_dir=None,
-            verbose=False,
-        )
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
+            result_msg = convert_file(
+                file_path=input_file,
+                output_format="markdown",
+                output_dir=None,
+                verbose=False,
+            )
 
         # 4. 검증
         assert "[Fail]" in result_msg
@@ -191,33 +340,37 @@ class TestConvertFileFunction:
         assert "[Error]" in result_msg
         assert "지원하지 않는 포맷" in result_msg
 
-    @patch("hwp_parser.cli.app.HWPConverter")
-    def test_convert_file_all_formats(self, mock_converter_cls, tmp_path) -> None:
-        """모든 지원 포맷에 대한 분기 테스트 (html, txt, odt)."""
-        input_file = tmp_path / "doc.hwp"
-        input_file.touch()
-
-        mock_instance = mock_converter_cls.return_value
-        mock_result = MagicMock()
-        mock_result.is_binary = False
-        mock_result.content = "content"
 
-        # 각 메서드 반환값 설정
-        mock_instance.to_html.return_value = mock_result
-        mock_instance.to_text.return_value = mock_result
-        mock_instance.to_odt.return_value = mock_result
+class TestConvertFileFormats:
+    """convert_file 포맷 분기 테스트 (html, txt, odt)."""
 
-        # HTML
-        convert_file(input_file, "html", None, False)
-        mock_instance.to_html.assert_called_once()
-
-        # TXT
-        convert_file(input_file, "txt", None, False)
-        mock_instance.to_text.assert_called_once()
+    @pytest.fixture(scope="class", autouse=True)
+    @staticmethod
+    def fake_converter():
+        """클래스 전체에서 공유하는 HWPConverter 대역
+
+        포맷 분기마다 swap을 새로 여는 대신 클래스당 한 번만 교체합니다.
+        호출 기록은 각 테스트가 직접 비우고 사용합니다.
+        """
+        mock_result = SimpleNamespace(is_binary=False, content="content")
+        fake = FakeConverter(result=mock_result)
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
+            yield fake
+
+    @pytest.mark.parametrize(
+        "output_format,method",
+        [("html", "to_html"), ("txt", "to_text"), ("odt", "to_odt")],
+    )
+    def test_convert_file_format_branch(
+        self, fake_converter, tmp_path, output_format, method
+    ) -> None:
+        """각 포맷이 대응하는 변환 메서드를 호출하는지 검증."""
+        input_file = tmp_path / "doc.hwp"
+        input_file.touch()
 
-        # ODT
-        convert_file(input_file, "odt", None, False)
-        mock_instance.to_odt.assert_called_once()
+        fake_converter.calls.clear()
+        convert_file(input_file, output_format, None, False)
+        assert fake_converter.calls == [method]
 
 
 class TestCliDiscovery:
@@ -232,38 +385,83 @@ class TestCliDiscovery:
             assert "Warning: 패턴 '*.hwp'에 매칭되는 파일이 없습니다." in result.output
             assert "변환할 파일이 없습니다." in result.output
 
-    def test_directory_input(self) -> None:
+    def test_directory_input(self, cli_mock_env) -> None:
         """디렉터리 입력 시 재귀 검색 테스트."""
-        runner = CliRunner()
+        runner, _ = cli_mock_env
         with runner.isolated_filesystem():
             # 디렉터리 구조 생성
             Path("subdir").mkdir()
             Path("subdir/test.hwp").touch()
 
-            with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-                mock_executor.return_value.__enter__.return_value = MagicMock()
-                with patch("hwp_parser.cli.app.as_completed", return_value=[]):
-                    result = runner.invoke(cli, ["convert", "subdir", "--workers", "1"])
+            result = runner.invoke(cli, ["convert", "subdir", "--workers", "1"])
 
-                    assert result.exit_code == 0
-                    assert "총 1개의 파일을 변환합니다" in result.output
+            assert result.exit_code == 0
+            assert "총 1개의 파일을 변환합니다" in result.output
 
-    def test_glob_pattern(self) -> None:
+    def test_glob_pattern(self, cli_mock_env) -> None:
         """Glob 패턴 입력 테스트."""
-        runner = CliRunner()
+        runner, _ = cli_mock_env
         with runner.isolated_filesystem():
             Path("a.hwp").touch()
             Path("b.hwp").touch()
             Path("c.txt").touch()
 
-            with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-                mock_executor.return_value.__enter__.return_value = MagicMock()
-                with patch("hwp_parser.cli.app.as_completed", return_value=[]):
-                    # 따옴표로 감싸서 쉘 확장이 아닌 내부 glob 로직을 타게 함 -> runner.invoke는 쉘 확장이 없으므로 그냥 전달됨
-                    result = runner.invoke(cli, ["convert", "*.hwp", "--workers", "1"])
+            # 따옴표로 감싸서 쉘 확장이 아닌 내부 glob 로직을 타게 함 -> runner.invoke는 쉘 확장이 없으므로 그냥 전달됨
+            result = runner.invoke(cli, ["convert", "*.hwp", "--workers", "1"])
+
+            assert result.exit_code == 0
+            assert "총 2개의 파일을 변환합니다" in result.output
 
-                    assert result.exit_code == 0
-                    assert "총 2개의 파일을 변환합니다" in result.output
+    def test_glob_pattern_matches_hidden_files(self, cli_mock_env) -> None:
+        """pathlib.Path.glob과 동일하게 숨김 파일도 매칭되는지 검증."""
+        runner, _ = cli_mock_env
+        with runner.isolated_filesystem():
+            Path("a.hwp").touch()
+            Path(".hidden.hwp").touch()
+
+            result = runner.invoke(cli, ["convert", "*.hwp", "--workers", "1"])
+
+            assert result.exit_code == 0
+            assert "총 2개의 파일을 변환합니다" in result.output
+
+    def test_wildcard_directory_pattern(self, cli_mock_env) -> None:
+        """디렉터리 부분에 와일드카드가 있는 패턴(sub*/*.hwp) 테스트."""
+        runner, _ = cli_mock_env
+        with runner.isolated_filesystem():
+            Path("subdir").mkdir()
+            Path("subdir/a.hwp").touch()
+            Path("other").mkdir()
+            Path("other/b.hwp").touch()
+
+            result = runner.invoke(cli, ["convert", "sub*/*.hwp", "--workers", "1"])
+
+            assert result.exit_code == 0
+            assert "총 1개의 파일을 변환합니다" in result.output
+
+    def test_multi_pattern_single_directory_scan(self, cli_mock_env) -> None:
+        """같은 디렉터리의 여러 패턴이 한 번의 디렉터리 읽기로 처리되는지 검증."""
+        runner, _ = cli_mock_env
+        with runner.isolated_filesystem():
+            Path("a.hwp").touch()
+            Path("b.hwp").touch()
+            Path("c.txt").touch()
+
+            scan_calls: list[Path] = []
+            original_scan = app._scan_names
+
+            def counting_scan(directory: Path) -> list[str]:
+                scan_calls.append(directory)
+                return original_scan(directory)
+
+            with swap(app, "_scan_names", counting_scan):
+                result = runner.invoke(
+                    cli, ["convert", "a*.hwp", "b*.hwp", "*.txt", "--workers", "1"]
+                )
+
+            assert result.exit_code == 0
+            assert "총 3개의 파일을 변환합니다" in result.output
+            # 패턴 3개가 디렉터리를 공유하므로 scandir는 1회
+            assert len(scan_calls) == 1
 
 
 class TestCliMain:
@@ -271,17 +469,17 @@ class TestCliMain:
 
     def test_main_calls_cli(self) -> None:
         """main() 함수가 cli()를 호출하는지 검증."""
-        with patch("hwp_parser.cli.app.cli") as mock_cli:
+        calls: list[bool] = []
+        with swap(app, "cli", lambda: calls.append(True)):
             main()
-            mock_cli.assert_called_once()
+        assert calls == [True]
 
     def test_cli_module_main_calls_app_main(self) -> None:
         """cli/__init__.py의 main이 app.main을 호출하는지 검증."""
-        from hwp_parser.cli import main as cli_main
-
-        with patch("hwp_parser.cli.app.cli") as mock_cli:
+        calls: list[bool] = []
+        with swap(app, "cli", lambda: calls.append(True)):
             cli_main()
-            mock_cli.assert_called_once()
+        assert calls == [True]
 
 
 class TestConvertFileOutputDir:
@@ -293,20 +491,17 @@ class TestConvertFileOutputDir:
         input_file.touch()
         output_dir = tmp_path / "output"
 
-        with patch("hwp_parser.cli.app.HWPConverter") as mock_converter_cls:
-            mock_instance = mock_converter_cls.return_value
-            mock_result = MagicMock()
-            mock_result.is_binary = False
-            mock_result.content = "# Test Content"
-            mock_instance.to_markdown.return_value = mock_result
+        mock_result = SimpleNamespace(is_binary=False, content="# Test Content")
+        fake = FakeConverter(result=mock_result)
 
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
             result = convert_file(input_file, "markdown", output_dir, False)
 
-            assert "[Success]" in result
-            assert output_dir.exists()
-            output_file = output_dir / "test.md"
-            assert output_file.exists()
-            assert output_file.read_text() == "# Test Content"
+        assert "[Success]" in result
+        assert output_dir.exists()
+        output_file = output_dir / "test.md"
+        assert output_file.exists()
+        assert output_file.read_text() == "# Test Content"
 
     def test_convert_file_with_output_dir_html(self, tmp_path: Path) -> None:
         """HTML 포맷으로 출력 디렉터리에 저장 (디렉터리 구조 검증)."""
@@ -314,23 +509,23 @@ class TestConvertFileOutputDir:
         input_file.touch()
         output_dir = tmp_path / "output"
 
-        with patch("hwp_parser.cli.app.HWPConverter") as mock_converter_cls:
-            mock_instance = mock_converter_cls.return_value
-            # HTMLDirResult mock
-            mock_result = MagicMock()
-            mock_result.xhtml_content = "<html>Test</html>"
-            mock_result.css_content = "body { color: black; }"
-            mock_result.bindata = {}
-            mock_instance.to_html.return_value = mock_result
+        # HTMLDirResult 대역
+        mock_result = SimpleNamespace(
+            xhtml_content="<html>Test</html>",
+            css_content="body { color: black; }",
+            bindata={},
+        )
+        fake = FakeConverter(result=mock_result)
 
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
             result = convert_file(input_file, "html", output_dir, False)
 
-            assert "[Success]" in result
-            # HTML은 디렉터리로 저장됨
-            html_dir = output_dir / "test"
-            assert html_dir.exists()
-            assert (html_dir / "index.xhtml").exists()
-            assert (html_dir / "styles.css").exists()
+        assert "[Success]" in result
+        # HTML은 디렉터리로 저장됨
+        html_dir = output_dir / "test"
+        assert html_dir.exists()
+        assert (html_dir / "index.xhtml").exists()
+        assert (html_dir / "styles.css").exists()
 
     def test_convert_file_with_output_dir_html_with_bindata(
         self, tmp_path: Path
@@ -340,21 +535,21 @@ class TestConvertFileOutputDir:
         input_file.touch()
         output_dir = tmp_path / "output"
 
-        with patch("hwp_parser.cli.app.HWPConverter") as mock_converter_cls:
-            mock_instance = mock_converter_cls.return_value
-            # HTMLDirResult mock with bindata
-            mock_result = MagicMock()
-            mock_result.xhtml_content = "<html>Test</html>"
-            mock_result.css_content = "body { color: black; }"
-            mock_result.bindata = {"image.png": b"PNG_DATA"}
-            mock_instance.to_html.return_value = mock_result
+        # bindata를 포함한 HTMLDirResult 대역
+        mock_result = SimpleNamespace(
+            xhtml_content="<html>Test</html>",
+            css_content="body { color: black; }",
+            bindata={"image.png": b"PNG_DATA"},
+        )
+        fake = FakeConverter(result=mock_result)
 
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
             result = convert_file(input_file, "html", output_dir, False)
 
-            assert "[Success]" in result
-            html_dir = output_dir / "test"
-            assert (html_dir / "bindata" / "image.png").exists()
-            assert (html_dir / "bindata" / "image.png").read_bytes() == b"PNG_DATA"
+        assert "[Success]" in result
+        html_dir = output_dir / "test"
+        assert (html_dir / "bindata" / "image.png").exists()
+        assert (html_dir / "bindata" / "image.png").read_bytes() == b"PNG_DATA"
 
     def test_convert_file_html_without_css(self, tmp_path: Path) -> None:
         """HTML 포맷으로 CSS 없이 저장 검증."""
@@ -362,27 +557,29 @@ class TestConvertFileOutputDir:
         input_file.touch()
         output_dir = tmp_path / "output"
 
-        with patch("hwp_parser.cli.app.HWPConverter") as mock_converter_cls:
-            mock_instance = mock_converter_cls.return_value
-            mock_result = MagicMock()
-            mock_result.xhtml_content = "<html>Test</html>"
-            mock_result.css_content = ""  # 빈 CSS
-            mock_result.bindata = {}
-            mock_instance.to_html.return_value = mock_result
+        mock_result = SimpleNamespace(
+            xhtml_content="<html>Test</html>",
+            css_content="",  # 빈 CSS
+            bindata={},
+        )
+        fake = FakeConverter(result=mock_result)
 
+        with swap(app, "HWPConverter", lambda **kwargs: fake):
             result = convert_file(input_file, "html", output_dir, False)
 
-            assert "[Success]" in result
-            html_dir = output_dir / "test"
-            assert (html_dir / "index.xhtml").exists()
-            # CSS가 비어있으면 파일이 생성되지 않음
-            assert not (html_dir / "styles.css").exists()
+        assert "[Success]" in result
+        html_dir = output_dir / "test"
+        assert (html_dir / "index.xhtml").exists()
+        # CSS가 비어있으면 파일이 생성되지 않음
+        assert not (html_dir / "styles.css").exists()
 
 
 class TestCliAbsolutePathGlob:
     """절대 경로 glob 패턴 테스트."""
 
-    def test_absolute_path_glob_pattern(self, tmp_path: Path) -> None:
+    def test_absolute_path_glob_pattern(
+        self, tmp_path: Path, cli_mock_env, capsys
+    ) -> None:
         """절대 경로 glob 패턴이 제대로 처리되는지 검증."""
         # tmp_path에 테스트 파일 생성
         test_file = tmp_path / "test.hwp"
@@ -391,14 +588,10 @@ class TestCliAbsolutePathGlob:
         # 절대 경로 glob 패턴
         abs_pattern = str(tmp_path / "*.hwp")
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_executor.return_value.__enter__.return_value = MagicMock()
-            with patch("hwp_parser.cli.app.as_completed", return_value=[]):
-                result = runner.invoke(cli, ["convert", abs_pattern, "--workers", "1"])
+        _run_cli(["convert", abs_pattern, "--workers", "1"])
 
-                assert result.exit_code == 0
-                assert "총 1개의 파일을 변환합니다" in result.output
+        captured = capsys.readouterr()
+        assert "총 1개의 파일을 변환합니다" in captured.out
 
 
 class TestCliFileNotFound:
@@ -419,178 +612,116 @@ class TestCliFileNotFound:
 class TestCliProgressAndVerbose:
     """진행바 및 verbose 출력 테스트."""
 
-    def test_verbose_output_on_success(self, tmp_path: Path) -> None:
+    def test_verbose_output_on_success(
+        self, tmp_path: Path, cli_mock_env, capsys
+    ) -> None:
         """verbose 모드에서 성공 메시지가 출력되는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        # ProcessPoolExecutor 내부의 convert_file을 mock할 수 없으므로
-        # Executor 자체를 mock하여 future를 직접 제어
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Success] test.hwp -> test.md"
-
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
-
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                result = runner.invoke(
-                    cli,
-                    ["convert", str(test_file), "--workers", "1", "--verbose"],
-                )
+        # ProcessPoolExecutor 내부의 convert_file을 교체할 수 없으므로
+        # Executor 자체를 대역으로 바꿔 future를 직접 제어
+        _, fake = cli_mock_env
+        fake.future = FakeFuture("[Success] test.hwp -> test.md")
+        _run_cli(["convert", str(test_file), "--workers", "1", "--verbose"])
 
-                assert result.exit_code == 0
-                assert "모든 작업이 완료되었습니다." in result.output
+        captured = capsys.readouterr()
+        assert "모든 작업이 완료되었습니다." in captured.out
 
-    def test_error_output_shown_without_verbose(self, tmp_path: Path) -> None:
+    def test_error_output_shown_without_verbose(
+        self, tmp_path: Path, cli_mock_env, capsys
+    ) -> None:
         """verbose가 아니어도 에러 메시지는 출력되는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Error] test.hwp: 변환 실패"
+        _, fake = cli_mock_env
+        fake.future = FakeFuture("[Error] test.hwp: 변환 실패")
+        _run_cli(["convert", str(test_file), "--workers", "1"])
 
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
+        captured = capsys.readouterr()
+        assert "모든 작업이 완료되었습니다." in captured.out
 
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                result = runner.invoke(
-                    cli,
-                    ["convert", str(test_file), "--workers", "1"],
-                )
-
-                assert result.exit_code == 0
-                assert "모든 작업이 완료되었습니다." in result.output
-
-    def test_fail_output_shown_without_verbose(self, tmp_path: Path) -> None:
+    def test_fail_output_shown_without_verbose(
+        self, tmp_path: Path, cli_mock_env, capsys
+    ) -> None:
         """verbose가 아니어도 Fail 메시지는 출력되는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Fail] test.hwp: 예외 발생"
-
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
-
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                result = runner.invoke(
-                    cli,
-                    ["convert", str(test_file), "--workers", "1"],
-                )
+        _, fake = cli_mock_env
+        fake.future = FakeFuture("[Fail] test.hwp: 예외 발생")
+        _run_cli(["convert", str(test_file), "--workers", "1"])
 
-                assert result.exit_code == 0
-                assert "모든 작업이 완료되었습니다." in result.output
+        captured = capsys.readouterr()
+        assert "모든 작업이 완료되었습니다." in captured.out
 
 
 class TestCliWorkersValidation:
     """workers 인자 검증 테스트."""
 
-    def test_workers_less_than_one_defaults_to_one(self, tmp_path: Path) -> None:
+    def test_workers_less_than_one_defaults_to_one(
+        self, tmp_path: Path, cli_mock_env
+    ) -> None:
         """workers가 1 미만인 경우 1로 설정되는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Success] test.hwp -> test.md"
-
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
+        _, fake = cli_mock_env
+        _run_cli(["convert", str(test_file), "--workers", "0"])
 
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                result = runner.invoke(
-                    cli,
-                    ["convert", str(test_file), "--workers", "0"],
-                )
-
-                assert result.exit_code == 0
-                # max_workers=1로 호출되었는지 검증
-                mock_executor.assert_called_once_with(max_workers=1)
+        # max_workers=1로 호출되었는지 검증
+        assert fake.init_kwargs == {"max_workers": 1}
 
 
 class TestCliProgressBarOutput:
     """progressbar 출력 분기 테스트."""
 
-    def test_verbose_with_visible_progressbar(self, tmp_path: Path) -> None:
+    def test_verbose_with_visible_progressbar(
+        self, tmp_path: Path, cli_mock_env
+    ) -> None:
         """progressbar가 visible일 때 verbose 출력이 동작하는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Success] test.hwp -> test.md"
+        _, fake = cli_mock_env
+        fake.future = FakeFuture("[Success] test.hwp -> test.md")
+        # progressbar 대역으로 is_hidden=False 설정
+        bar = FakeProgressBar(is_hidden=False)
 
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
+        with swap(app, "_progressbar", lambda **kwargs: bar):
+            _run_cli(["convert", str(test_file), "--workers", "1", "--verbose"])
 
-            # progressbar를 mock하여 is_hidden=False 설정
-            mock_bar = MagicMock()
-            mock_bar.is_hidden = False
+        # bar.update가 호출되었는지 검증
+        assert bar.updates == [1]
 
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                with patch("click.progressbar") as mock_progressbar:
-                    mock_progressbar.return_value.__enter__.return_value = mock_bar
-
-                    result = runner.invoke(
-                        cli,
-                        ["convert", str(test_file), "--workers", "1", "--verbose"],
-                    )
-
-                    assert result.exit_code == 0
-                    # bar.update가 호출되었는지 검증
-                    mock_bar.update.assert_called_once_with(1)
-
-    def test_verbose_with_hidden_progressbar(self, tmp_path: Path) -> None:
+    def test_verbose_with_hidden_progressbar(
+        self, tmp_path: Path, cli_mock_env
+    ) -> None:
         """progressbar가 hidden일 때 출력이 스킵되는지 검증."""
         test_file = tmp_path / "test.hwp"
         test_file.touch()
 
-        runner = CliRunner()
-        with patch("hwp_parser.cli.app.ProcessPoolExecutor") as mock_executor:
-            mock_future = MagicMock()
-            mock_future.result.return_value = "[Error] test.hwp: 변환 실패"
-
-            mock_executor_instance = MagicMock()
-            mock_executor_instance.submit.return_value = mock_future
-            mock_executor.return_value.__enter__.return_value = mock_executor_instance
-
-            # progressbar를 mock하여 is_hidden=True 설정
-            mock_bar = MagicMock()
-            mock_bar.is_hidden = True
-
-            with patch("hwp_parser.cli.app.as_completed", return_value=[mock_future]):
-                with patch("click.progressbar") as mock_progressbar:
-                    mock_progressbar.return_value.__enter__.return_value = mock_bar
-
-                    # click.echo를 모니터링하여 에러 메시지가 출력되지 않는지 확인
-                    with patch("hwp_parser.cli.app.click.echo") as mock_echo:
-                        result = runner.invoke(
-                            cli,
-                            ["convert", str(test_file), "--workers", "1"],
-                        )
-
-                        assert result.exit_code == 0
-                        # is_hidden=True이면 에러 메시지가 click.echo로 출력되지 않음
-                        # 단, "모든 작업이 완료되었습니다."는 출력됨
-                        echo_calls = [
-                            call
-                            for call in mock_echo.call_args_list
-                            if "[Error]" in str(call)
-                        ]
-                        assert len(echo_calls) == 0
+        _, fake = cli_mock_env
+        fake.future = FakeFuture("[Error] test.hwp: 변환 실패")
+        # progressbar 대역으로 is_hidden=True 설정
+        bar = FakeProgressBar(is_hidden=True)
+
+        # click.echo 호출을 기록하여 에러 메시지가 출력되지 않는지 확인
+        echo_calls: list[str] = []
+
+        def record_echo(message=None, **kwargs) -> None:
+            echo_calls.append(str(message))
+
+        with (
+            swap(app, "_progressbar", lambda **kwargs: bar),
+            swap(click, "echo", record_echo),
+        ):
+            _run_cli(["convert", str(test_file), "--workers", "1"])
+
+        # is_hidden=True이면 에러 메시지가 click.echo로 출력되지 않음
+        # 단, "모든 작업이 완료되었습니다."는 출력됨
+        assert not any("[Error]" in call for call in echo_calls)
 
 
 class TestCliIntegration:
@@ -606,29 +737,55 @@ class TestCliIntegration:
         4. 여러 파일 동시 변환
     """
 
+    @pytest.fixture(scope="class", autouse=True)
+    @staticmethod
+    def _thread_pool_executor():
+        """통합 테스트 동안 ProcessPoolExecutor를 ThreadPoolExecutor로 교체
+
+        1~3개 파일 변환에서는 워커 프로세스 fork와 인터프리터 기동 비용이
+        병렬화 이득을 압도합니다. ThreadPoolExecutor도 동일한
+        submit/as_completed 경로를 타므로 Executor 코드 경로는 그대로
+        검증됩니다.
+        """
+        with swap(app, "ProcessPoolExecutor", ThreadPoolExecutor):
+            yield
+
+    @pytest.fixture(scope="class")
     @staticmethod
-    def get_sample_hwp() -> Path:
-        """테스트용 HWP 파일 경로 반환."""
-        fixtures_dir = Path(__file__).parent / "fixtures"
-        hwp_files = list(fixtures_dir.glob("*.hwp"))
-        if not hwp_files:
-            return None
-        return hwp_files[0]
-
-    def test_convert_to_markdown_integration(self, tmp_path: Path) -> None:
-        """실제 HWP 파일을 Markdown으로 변환 통합 테스트."""
-        sample_hwp = self.get_sample_hwp()
-        if sample_hwp is None:
-            import pytest
-
-            pytest.skip("테스트용 HWP 파일이 없습니다.")
+    def converted_results(converter, sample_hwp_file: Path):
+        """샘플 HWP를 한 번만 파싱해 세 포맷의 결과를 공유 (클래스 공유)
+
+        포맷별 CLI 호출은 같은 파일을 매번 다시 파싱합니다. 포맷 분기
+        검증은 to_many()로 HTML 변환 1회를 공유한 결과에 대해 수행하고,
+        CLI 전체 경로는 아래 end-to-end 테스트 하나로 검증합니다.
+        """
+        return converter.to_many(sample_hwp_file, ["markdown", "txt", "html"])
+
+    @pytest.mark.parametrize("output_format", ["markdown", "txt"])
+    def test_convert_text_formats_integration(
+        self, converted_results, output_format: str
+    ) -> None:
+        """markdown/txt 변환 결과 내용 검증 (파싱 1회 공유)."""
+        result = converted_results[output_format]
+        assert not result.is_binary
+        assert len(result.content) > 30  # 최소 내용 확인 (샘플 파일에 따라 다를 수 있음)
+
+    def test_convert_html_integration(self, converted_results) -> None:
+        """HTML 변환 결과 형식 검증 (파싱 1회 공유)."""
+        html_result = converted_results["html"]
+        content = html_result.xhtml_content
+        assert "<html" in content.lower() or "xhtml" in content.lower()
 
+    def test_convert_cli_end_to_end(
+        self, tmp_path: Path, sample_hwp_file: Path
+    ) -> None:
+        """실제 HWP 파일을 CLI 전체 경로로 변환하는 end-to-end 테스트."""
         runner = CliRunner()
         result = runner.invoke(
             cli,
             [
                 "convert",
-                str(sample_hwp),
+                str(sample_hwp_file),
                 "--format",
                 "markdown",
                 "--output-dir",
@@ -648,85 +805,17 @@ class TestCliIntegration:
 
         # 파일 내용 확인 (비어있지 않아야 함)
         content = output_files[0].read_text(encoding="utf-8")
-        assert len(content) > 30  # 최소 내용 확인 (샘플 파일에 따라 길이가 다를 수 있음)
-
-    def test_convert_to_html_integration(self, tmp_path: Path) -> None:
-        """실제 HWP 파일을 HTML로 변환 통합 테스트 (디렉터리 구조)."""
-        sample_hwp = self.get_sample_hwp()
-        if sample_hwp is None:
-            import pytest
-
-            pytest.skip("테스트용 HWP 파일이 없습니다.")
-
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                str(sample_hwp),
-                "--format",
-                "html",
-                "--output-dir",
-                str(tmp_path),
-                "--workers",
-                "1",
-            ],
-        )
-
-        assert result.exit_code == 0
-
-        # HTML은 디렉터리로 저장됨 (파일명.stem 디렉터리)
-        output_dirs = [d for d in tmp_path.iterdir() if d.is_dir()]
-        assert len(output_dirs) == 1
-
-        html_dir = output_dirs[0]
-        assert (html_dir / "index.xhtml").exists()
-
-        content = (html_dir / "index.xhtml").read_text(encoding="utf-8")
-        assert "<html" in content.lower() or "xhtml" in content.lower()
-
-    def test_convert_to_txt_integration(self, tmp_path: Path) -> None:
-        """실제 HWP 파일을 TXT로 변환 통합 테스트."""
-        sample_hwp = self.get_sample_hwp()
-        if sample_hwp is None:
-            import pytest
-
-            pytest.skip("테스트용 HWP 파일이 없습니다.")
-
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                str(sample_hwp),
-                "--format",
-                "txt",
-                "--output-dir",
-                str(tmp_path),
-                "--workers",
-                "1",
-            ],
-        )
-
-        assert result.exit_code == 0
-
-        output_files = list(tmp_path.glob("*.txt"))
-        assert len(output_files) == 1
-
-        content = output_files[0].read_text(encoding="utf-8")
-        assert len(content) > 30  # 텍스트 내용이 있어야 함
+        assert len(content) > 30
 
-    def test_convert_multiple_files_integration(self, tmp_path: Path) -> None:
+    def test_convert_multiple_files_integration(
+        self, tmp_path: Path, small_hwp_files: list[Path]
+    ) -> None:
         """여러 HWP 파일을 동시에 변환하는 통합 테스트."""
-        fixtures_dir = Path(__file__).parent / "fixtures"
-        hwp_files = list(fixtures_dir.glob("*.hwp"))
-        if len(hwp_files) < 2:
-            import pytest
-
+        if len(small_hwp_files) < 2:
             pytest.skip("테스트용 HWP 파일이 2개 미만입니다.")
 
-        # 처음 3개 파일만 테스트 (시간 단축)
-        test_files = hwp_files[:3]
+        # 작은 파일 3개만 테스트 (시간 단축)
+        test_files = small_hwp_files
 
         runner = CliRunner()
         result = runner.invoke(
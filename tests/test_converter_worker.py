@@ -169,6 +169,34 @@ class TestWorkerModeIntegration:
                 assert isinstance(result.content, str)
 
 
+class TestWorkerModeBatchConversion:
+    """워커 모드 convert_many 일괄 제출 테스트.
+
+    테스트 대상:
+        - convert_many()의 워커 풀 일괄 제출 경로
+
+    검증 범위:
+        1. 작업 일괄 제출 후에도 결과가 입력 순서로 반환
+        2. 파이프라인 문자열에 "worker" 포함
+    """
+
+    def test_convert_many_preserves_order(self) -> None:
+        """여러 워커에 일괄 제출해도 입력 순서가 유지되는지 검증."""
+        fixtures_dir = Path(__file__).parent / "fixtures"
+        hwp_files = sorted(fixtures_dir.glob("*.hwp"))[:3]
+        if not hwp_files:
+            pytest.skip("테스트용 HWP 파일이 없습니다.")
+
+        with HWPConverter(num_workers=2) as converter:
+            results = list(converter.convert_many(hwp_files, "txt"))
+
+        assert [r.source_path for r in results] == hwp_files
+        for result in results:
+            assert result.output_format == "txt"
+            assert "worker" in result.pipeline
+            assert isinstance(result.content, str)
+
+
 class TestWorkerModeHtmlWithBinData:
     """워커 모드 bindata 포함 HTML 변환 테스트.
 
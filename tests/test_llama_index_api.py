@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import builtins
 import importlib
+import os
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Literal
 
 import pytest
@@ -191,6 +193,200 @@ class TestHWPReaderCompatibility:
         assert len(docs) == len(small_hwp_files)
 
 
+class _CountingConverter:
+    """convert() 호출 횟수를 기록하는 HWPConverter 대역."""
+
+    def __init__(self) -> None:
+        self.convert_calls = 0
+
+    def convert(self, file: Path, output_format: str) -> SimpleNamespace:
+        self.convert_calls += 1
+        return SimpleNamespace(
+            is_binary=False,
+            content=f"{output_format}-content-{self.convert_calls}",
+            source_name=file.name,
+            source_path=file,
+            pipeline=f"hwp→xhtml→{output_format}",
+        )
+
+
+class TestHWPReaderCache:
+    """HWPReader 변환 결과 캐시 테스트 스위트.
+
+    테스트 대상:
+        - load_data()의 stat 기반 LRU 캐시
+
+    검증 범위:
+        1. 변경되지 않은 파일 재로드 → convert() 재호출 없음
+        2. 파일 수정(mtime 변경) → 캐시 무효화 후 재변환
+        3. output_format이 캐시 키에 포함
+
+    비즈니스 컨텍스트:
+        인제스천 루프에서 같은 파일을 반복 로드할 때 변환을
+        건너뛰되, 파일이 바뀌면 반드시 다시 변환해야 한다.
+
+    관련 테스트:
+        - TestHWPReaderWorkerLifecycle: 변환기 위임
+    """
+
+    @pytest.fixture
+    def cached_reader(self, tmp_path: Path) -> tuple[HWPReader, _CountingConverter, Path]:
+        """대역 변환기를 주입한 리더와 임시 HWP 파일."""
+        hwp_file = tmp_path / "doc.hwp"
+        hwp_file.write_bytes(b"dummy")
+
+        reader = HWPReader()
+        fake = _CountingConverter()
+        reader._converter = fake  # type: ignore[assignment]
+        return reader, fake, hwp_file
+
+    def test_unchanged_file_hits_cache(
+        self, cached_reader: tuple[HWPReader, _CountingConverter, Path]
+    ) -> None:
+        """변경되지 않은 파일 재로드 시 convert()를 건너뛰는지 검증.
+
+        시나리오:
+            같은 파일을 두 번 load_data()하면 두 번째 호출은
+            캐시에서 결과를 꺼내고 변환기를 호출하지 않는다.
+        """
+        reader, fake, hwp_file = cached_reader
+
+        first = reader.load_data(hwp_file)
+        second = reader.load_data(hwp_file)
+
+        assert fake.convert_calls == 1
+        assert first[0].text == second[0].text
+
+    def test_modified_file_invalidates_cache(
+        self, cached_reader: tuple[HWPReader, _CountingConverter, Path]
+    ) -> None:
+        """파일 수정 시 캐시가 무효화되고 재변환되는지 검증.
+
+        시나리오:
+            캐시 키는 (경로, mtime_ns, size)를 포함하므로
+            mtime이 바뀌면 기존 항목은 매칭되지 않아야 한다.
+        """
+        reader, fake, hwp_file = cached_reader
+
+        reader.load_data(hwp_file)
+        st = hwp_file.stat()
+        os.utime(hwp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        reader.load_data(hwp_file)
+
+        assert fake.convert_calls == 2
+
+    def test_output_format_part_of_cache_key(
+        self, cached_reader: tuple[HWPReader, _CountingConverter, Path]
+    ) -> None:
+        """다른 output_format은 별도 캐시 항목인지 검증.
+
+        시나리오:
+            같은 파일이라도 포맷이 다르면 변환 결과가 다르므로
+            포맷별로 변환이 수행되어야 한다.
+        """
+        reader, fake, hwp_file = cached_reader
+
+        reader.load_data(hwp_file, output_format="markdown")
+        reader.load_data(hwp_file, output_format="txt")
+        reader.load_data(hwp_file, output_format="markdown")
+
+        assert fake.convert_calls == 2
+
+
+class _RecordingConverter:
+    """워커 수명주기 호출을 기록하는 HWPConverter 대역."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __enter__(self) -> "_RecordingConverter":
+        self.calls.append("enter")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.calls.append("exit")
+
+    def _shutdown_workers(self) -> None:
+        self.calls.append("shutdown")
+
+
+class TestHWPReaderWorkerLifecycle:
+    """HWPReader 워커 수명주기 테스트 스위트.
+
+    테스트 대상:
+        - HWPReader(num_workers=...) 전달
+        - close(), __enter__/__exit__의 변환기 위임
+
+    비즈니스 컨텍스트:
+        Worker Pool 모드의 워커 시작/정리는 HWPConverter가 담당하고,
+        HWPReader는 이를 그대로 위임해야 한다.
+
+    관련 테스트:
+        - test_python_api: HWPConverter 자체의 워커 동작
+    """
+
+    def test_num_workers_forwarded_to_converter(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """num_workers 인자가 HWPConverter에 전달되는지 검증.
+
+        시나리오:
+            HWPReader(num_workers=3)은 내부 변환기를
+            HWPConverter(num_workers=3)으로 생성해야 한다.
+
+        의존성:
+            - mock: reader_module.HWPConverter (생성 인자 기록)
+        """
+        from hwp_parser.adapters.llama_index import reader as reader_module
+
+        captured: dict[str, int | None] = {}
+
+        class _FakeConverter:
+            def __init__(self, num_workers: int | None = None) -> None:
+                captured["num_workers"] = num_workers
+
+        monkeypatch.setattr(reader_module, "HWPConverter", _FakeConverter)
+        reader_module.HWPReader(num_workers=3)
+        assert captured["num_workers"] == 3
+
+    def test_context_manager_delegates_to_converter(self) -> None:
+        """컨텍스트 매니저가 변환기의 워커 수명주기에 위임하는지 검증.
+
+        시나리오:
+            with HWPReader(...) as r: 진입 시 변환기의 __enter__,
+            종료 시 __exit__이 호출되어 워커가 시작/정리되어야 한다.
+
+        의존성:
+            - mock: _RecordingConverter (enter/exit 호출 기록)
+        """
+        reader = HWPReader()
+        fake = _RecordingConverter()
+        reader._converter = fake  # type: ignore[assignment]
+
+        with reader as entered:
+            assert entered is reader
+            assert fake.calls == ["enter"]
+
+        assert fake.calls == ["enter", "exit"]
+
+    def test_close_shuts_down_workers(self) -> None:
+        """close()가 변환기의 워커 정리를 호출하는지 검증.
+
+        시나리오:
+            컨텍스트 매니저 없이 사용한 경우에도 close()로
+            워커 프로세스를 정리할 수 있어야 한다.
+
+        의존성:
+            - mock: _RecordingConverter (shutdown 호출 기록)
+        """
+        reader = HWPReader()
+        fake = _RecordingConverter()
+        reader._converter = fake  # type: ignore[assignment]
+
+        reader.close()
+        assert fake.calls == ["shutdown"]
+
+
 # === 에지 케이스 ===
 
 
@@ -224,6 +224,33 @@ class TestToHtml:
             assert "index.xhtml" in names
             assert "styles.css" in names
 
+    def test_to_zip_bytes_compress_types(self, tmp_path: Path) -> None:
+        """bindata 압축 방식 확인 (이미지는 STORED, 텍스트는 DEFLATED).
+
+        Given: 이미지/텍스트 bindata가 섞인 HTMLDirResult
+        When: to_zip_bytes 호출
+        Then: 이미지는 ZIP_STORED, 텍스트 계열과 xhtml/css는 ZIP_DEFLATED
+        """
+        import zipfile
+        from io import BytesIO
+
+        from hwp_parser.core import HTMLDirResult
+
+        result = HTMLDirResult(
+            xhtml_content="<html><body>본문</body></html>",
+            css_content="body { margin: 0; }",
+            bindata={"image1.png": b"\x89PNG...", "diagram.svg": b"<svg/>"},
+            source_path=tmp_path / "sample.hwp",
+        )
+
+        with zipfile.ZipFile(BytesIO(result.to_zip_bytes()), "r") as zf:
+            compress = {info.filename: info.compress_type for info in zf.infolist()}
+
+        assert compress["index.xhtml"] == zipfile.ZIP_DEFLATED
+        assert compress["styles.css"] == zipfile.ZIP_DEFLATED
+        assert compress["bindata/diagram.svg"] == zipfile.ZIP_DEFLATED
+        assert compress["bindata/image1.png"] == zipfile.ZIP_STORED
+
     def test_get_preview_html(
         self, converter: HWPConverter, sample_hwp_file: Path
     ) -> None:
@@ -355,6 +382,192 @@ class TestToText:
         assert "<body" not in content.lower()
 
 
+try:
+    import selectolax  # noqa: F401
+
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
+
+def _text_lines(text: str) -> list[str]:
+    """줄 단위 출력 비교용 정규화.
+
+    빈 줄을 제외하고 줄 내 연속 공백을 한 칸으로 접는다. 줄 구조(구절
+    중간 개행 여부)와 내용은 비교하되, html2text가 span 경계에서 남기는
+    여분 공백 같은 엔진별 공백 차이는 무시한다.
+    """
+    return [" ".join(line.split()) for line in text.splitlines() if line.strip()]
+
+
+class _StubSelectolaxNode:
+    """selectolax 노드의 최소 대역 (fast path가 쓰는 text()만 구현)."""
+
+    def __init__(self, html: str) -> None:
+        self._html = html
+
+    def text(self, separator: str = "") -> str:
+        import re
+
+        return separator.join(re.findall(r">([^<>]+)<", self._html))
+
+
+class _StubSelectolaxParser:
+    """selectolax HTMLParser의 최소 대역.
+
+    fast path가 의존하는 API(body, css, css_first)만 흉내 내어 selectolax
+    미설치 환경에서도 빠른 경로 분기를 실제로 실행할 수 있게 한다.
+    """
+
+    def __init__(self, html: str) -> None:
+        import re
+
+        self._html = html
+        self.body = _StubSelectolaxNode(html) if "<body" in html else None
+        self._re = re
+
+    def css(self, selector: str) -> list[_StubSelectolaxNode]:
+        pattern = rf"<{selector}[\s>].*?</{selector}>"
+        return [
+            _StubSelectolaxNode(m)
+            for m in self._re.findall(pattern, self._html, self._re.S)
+        ]
+
+    def css_first(self, selector: str) -> object | None:
+        for tag in (s.strip() for s in selector.split(",")):
+            if self._re.search(rf"<{tag}[\s>]", self._html):
+                return object()
+        return None
+
+
+class TestPlainTextFastPath:
+    """_plain_text_fast_path 테스트 스위트.
+
+    테스트 대상:
+        - converter._plain_text_fast_path() (selectolax 빠른 경로)
+
+    검증 범위:
+        1. 서식 없는 문서에서 빠른 경로와 html2text 폴백의 텍스트 일치
+        2. 제목/강조 등 html2text가 마크업으로 렌더링하는 태그 → 폴백
+        3. selectolax 미설치(파서 None) → 폴백
+
+    테스트 전략:
+        selectolax는 선택적 의존성(speed extra)이므로 최소 대역 파서를
+        주입해 빠른 경로 분기를 실행한다.
+    """
+
+    PLAIN_XHTML = (
+        "<html><body>"
+        "<p>안녕하세요 문서입니다.</p>"
+        "<p>두 번째 문단입니다.</p>"
+        "</body></html>"
+    )
+
+    @pytest.fixture
+    def _stub_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """빠른 경로가 실행되도록 대역 파서를 주입."""
+        from hwp_parser.core import converter as converter_module
+
+        monkeypatch.setattr(
+            converter_module, "_SelectolaxParser", _StubSelectolaxParser
+        )
+
+    def test_fast_path_agrees_with_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, _stub_parser: None
+    ) -> None:
+        """서식 없는 문서에서 빠른 경로와 폴백의 결과 일치.
+
+        Given: 문단만 있는 XHTML과 대역 파서
+        When: 빠른 경로와 html2text 폴백으로 각각 텍스트 추출
+        Then: 공백 정규화 후 동일한 텍스트
+        """
+        from hwp_parser.core import converter as converter_module
+
+        fast = converter_module._plain_text_fast_path(self.PLAIN_XHTML)
+        assert fast is not None
+
+        monkeypatch.setattr(converter_module, "_SelectolaxParser", None)
+        fallback = HWPConverter()._xhtml_to_text(self.PLAIN_XHTML)
+
+        assert _text_lines(fast) == _text_lines(fallback)
+
+    def test_multi_span_phrase_stays_on_one_line(self, _stub_parser: None) -> None:
+        """여러 <span>으로 쪼개진 구절이 한 줄로 유지되는지 검증.
+
+        Given: hwp5html처럼 한 구절이 여러 <span>으로 나뉜 문단
+        When: _plain_text_fast_path 호출
+        Then: 구절 중간에 개행 없이 한 줄로 반환
+        """
+        from hwp_parser.core import converter as converter_module
+
+        xhtml = (
+            "<html><body>"
+            "<p><span>지침(</span><span>ER-177-02)</span></p>"
+            "</body></html>"
+        )
+        assert converter_module._plain_text_fast_path(xhtml) == "지침(ER-177-02)"
+
+    @pytest.mark.skipif(
+        not _HAS_SELECTOLAX, reason="selectolax 미설치 (speed extra)"
+    )
+    def test_fast_path_agrees_on_real_fixture(
+        self,
+        converter: HWPConverter,
+        all_hwp_files: list[Path],
+    ) -> None:
+        """실제 픽스처 XHTML에서 빠른 경로와 폴백의 결과 일치.
+
+        Given: 실제 hwp5html 출력 XHTML과 진짜 selectolax 파서
+        When: 빠른 경로와 html2text 폴백으로 각각 텍스트 추출
+        Then: 빠른 경로가 적용되는 모든 픽스처에서 줄 단위로 동일
+        """
+        from hwp_parser.core import converter as converter_module
+
+        checked = 0
+        for hwp_file in all_hwp_files:
+            xhtml = converter.to_html(hwp_file).xhtml_content
+            fast = converter_module._plain_text_fast_path(xhtml)
+            if fast is None:
+                continue
+
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(converter_module, "_SelectolaxParser", None)
+                fallback = converter._xhtml_to_text(xhtml)
+
+            assert _text_lines(fast) == _text_lines(fallback), hwp_file.name
+            checked += 1
+
+        if not checked:
+            pytest.skip("빠른 경로가 적용되는 서식 없는 픽스처가 없음")
+
+    @pytest.mark.parametrize("tag", ["h1", "h3", "strong", "b", "em", "table"])
+    def test_formatting_tags_fall_back(self, tag: str, _stub_parser: None) -> None:
+        """서식 태그가 있으면 빠른 경로를 포기.
+
+        Given: 제목/강조/테이블 태그가 포함된 XHTML
+        When: _plain_text_fast_path 호출
+        Then: None 반환 (html2text 경로로 폴백)
+        """
+        from hwp_parser.core import converter as converter_module
+
+        xhtml = f"<html><body><{tag}>내용</{tag}></body></html>"
+        assert converter_module._plain_text_fast_path(xhtml) is None
+
+    def test_parser_missing_falls_back(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """selectolax 미설치 시 None 반환.
+
+        Given: _SelectolaxParser = None (미설치 상태)
+        When: _plain_text_fast_path 호출
+        Then: None 반환
+        """
+        from hwp_parser.core import converter as converter_module
+
+        monkeypatch.setattr(converter_module, "_SelectolaxParser", None)
+        assert converter_module._plain_text_fast_path(self.PLAIN_XHTML) is None
+
+
 class TestToMarkdown:
     """Markdown 변환 테스트 스위트.
 
@@ -500,6 +713,213 @@ class TestConvert:
         assert result.output_format == "markdown"
 
 
+class TestToMany:
+    """to_many() 다중 포맷 변환 테스트 스위트.
+
+    테스트 대상:
+        - HWPConverter.to_many(file, formats) 메서드
+
+    검증 범위:
+        1. 요청한 포맷별 결과 딕셔너리 반환
+        2. txt/markdown/html이 XHTML 변환 1회를 공유
+        3. 미지원 포맷 입력 시 ValueError
+
+    비즈니스 컨텍스트:
+        인덱싱(txt) + 미리보기(markdown/html)처럼 같은 파일을 여러 포맷으로
+        소비하는 호출자가 포맷별 convert() 반복 대신 사용하는 진입점이다.
+
+    관련 테스트:
+        - TestConvert: 단일 포맷 라우팅
+    """
+
+    def test_to_many_returns_requested_formats(
+        self, converter: HWPConverter, sample_hwp_file: Path
+    ) -> None:
+        """요청한 포맷별 결과 반환.
+
+        Given: 유효한 HWP 파일
+        When: to_many(file, ["txt", "markdown", "html"]) 호출
+        Then: 포맷별 결과가 담긴 dict, output_format 일치
+        """
+        results = converter.to_many(sample_hwp_file, ["txt", "markdown", "html"])
+
+        assert set(results) == {"txt", "markdown", "html"}
+        assert results["txt"].output_format == "txt"
+        assert results["markdown"].output_format == "markdown"
+        assert results["html"].output_format == "html"
+
+    def test_to_many_shares_single_html_conversion(
+        self, converter: HWPConverter, sample_hwp_file: Path, monkeypatch
+    ) -> None:
+        """txt/markdown이 to_html 1회를 공유.
+
+        Given: to_html 호출 횟수를 세는 래퍼
+        When: to_many(file, ["txt", "markdown", "html"]) 호출
+        Then: to_html은 한 번만 호출됨
+        """
+        calls = []
+        original = HWPConverter.to_html
+
+        def counting_to_html(self, file_path):
+            calls.append(file_path)
+            return original(self, file_path)
+
+        monkeypatch.setattr(HWPConverter, "to_html", counting_to_html)
+        converter.to_many(sample_hwp_file, ["txt", "markdown", "html"])
+
+        assert len(calls) == 1
+
+    def test_to_many_text_matches_to_text(
+        self, converter: HWPConverter, sample_hwp_file: Path
+    ) -> None:
+        """to_many의 txt 결과가 to_text와 동일.
+
+        Given: 유효한 HWP 파일
+        When: to_many와 to_text를 각각 호출
+        Then: content 동일
+        """
+        results = converter.to_many(sample_hwp_file, ["txt"])
+        assert results["txt"].content == converter.to_text(sample_hwp_file).content
+
+    def test_to_many_unsupported_format(
+        self, converter: HWPConverter, sample_hwp_file: Path
+    ) -> None:
+        """미지원 포맷 → ValueError.
+
+        Given: 미지원 포맷 "pdf"
+        When: to_many 호출
+        Then: ValueError("지원하지 않는 포맷") 발생
+        """
+        with pytest.raises(ValueError, match="지원하지 않는 포맷"):
+            converter.to_many(sample_hwp_file, ["txt", "pdf"])  # type: ignore
+
+
+class TestConvertMany:
+    """convert_many() 배치 변환 테스트 스위트.
+
+    테스트 대상:
+        - HWPConverter.convert_many(paths, output_format) 메서드
+
+    검증 범위:
+        1. 입력 순서를 유지한 lazy iterator 반환
+        2. 파일 수만큼 ConversionResult 생성
+        3. 미지원 포맷 입력 시 ValueError
+
+    비즈니스 컨텍스트:
+        배치 인제스천에서 파일별 convert() 반복 호출 대신 사용하는
+        진입점이다. Worker Pool 모드에서는 워커 초기화 비용이
+        배치 전체에 한 번만 든다.
+
+    관련 테스트:
+        - TestConvert: 단일 파일 convert() 라우팅
+    """
+
+    def test_convert_many_yields_all_results(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """파일 수만큼 결과 생성 + 입력 순서 유지.
+
+        Given: 작은 HWP 파일 목록
+        When: convert_many(files, "txt") 소비
+        Then: 파일 수만큼 결과, source_path 순서 일치
+        """
+        results = list(converter.convert_many(small_hwp_files, "txt"))
+
+        assert len(results) == len(small_hwp_files)
+        assert [r.source_path for r in results] == small_hwp_files
+        assert all(r.output_format == "txt" for r in results)
+
+    def test_convert_many_is_lazy(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """lazy iterator 동작 확인.
+
+        Given: 작은 HWP 파일 목록
+        When: convert_many 호출 (소비 전)
+        Then: iterator 반환, next() 시 첫 결과 생성
+        """
+        iterator = converter.convert_many(small_hwp_files, "markdown")
+
+        first = next(iterator)
+        assert first.source_path == small_hwp_files[0]
+        assert first.output_format == "markdown"
+
+    def test_convert_many_unsupported_format(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """미지원 포맷 → ValueError.
+
+        Given: 미지원 포맷 "pdf"
+        When: convert_many 소비
+        Then: ValueError("지원하지 않는 포맷") 발생
+        """
+        with pytest.raises(ValueError, match="지원하지 않는 포맷"):
+            list(converter.convert_many(small_hwp_files, "pdf"))  # type: ignore
+
+
+class TestConvertAll:
+    """convert_all() 병렬 배치 변환 테스트 스위트.
+
+    테스트 대상:
+        - HWPConverter.convert_all(paths, output_format, max_workers) 메서드
+
+    검증 범위:
+        1. 파일 수만큼 ConversionResult 생성 (완료 순서)
+        2. max_workers 지정 동작
+        3. 미지원 포맷 입력 시 ValueError
+
+    비즈니스 컨텍스트:
+        기본 경로는 인-프로세스 pyhwp 백엔드라 스레드 풀은 파일 I/O와
+        C 확장 구간의 겹침만 기대할 수 있고, 완전한 병렬화는 CLI
+        폴백(외부 프로세스)이나 Worker Pool 모드에서만 가능하다.
+        여기서는 병렬 정도와 무관하게 결과 수집의 정확성을 검증한다.
+
+    관련 테스트:
+        - TestConvertMany: 순차 배치 변환
+    """
+
+    def test_convert_all_returns_all_results(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """파일 수만큼 결과 생성 (완료 순서).
+
+        Given: 작은 HWP 파일 목록
+        When: convert_all(files, "txt") 소비
+        Then: 파일 수만큼 결과, 모든 입력 파일 포함
+        """
+        results = list(converter.convert_all(small_hwp_files, "txt"))
+
+        assert len(results) == len(small_hwp_files)
+        assert {r.source_path for r in results} == set(small_hwp_files)
+        assert all(r.output_format == "txt" for r in results)
+
+    def test_convert_all_with_max_workers(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """max_workers 지정 시 정상 동작.
+
+        Given: max_workers=1 (순차와 동일한 동작)
+        When: convert_all 소비
+        Then: 파일 수만큼 결과 생성
+        """
+        results = list(
+            converter.convert_all(small_hwp_files, "markdown", max_workers=1)
+        )
+        assert len(results) == len(small_hwp_files)
+
+    def test_convert_all_unsupported_format(
+        self, converter: HWPConverter, small_hwp_files: list[Path]
+    ) -> None:
+        """미지원 포맷 → ValueError.
+
+        Given: 미지원 포맷 "pdf"
+        When: convert_all 소비
+        Then: ValueError("지원하지 않는 포맷") 발생
+        """
+        with pytest.raises(ValueError, match="지원하지 않는 포맷"):
+            list(converter.convert_all(small_hwp_files, "pdf"))  # type: ignore
+
+
 class TestConversionResult:
     """ConversionResult 데이터클래스 테스트 스위트.
 
@@ -628,17 +1048,27 @@ class TestConverterErrorPaths:
         3. RelaxNG 검증 실패 → 명확한 에러 메시지
 
     비즈니스 컨텍스트:
-        HWPConverter는 내부적으로 pyhwp CLI(hwp5html, hwp5odt)를
-        subprocess로 호출한다. 외부 도구 실패 시 명확한 예외를 전달해야 한다.
+        HWPConverter는 pyhwp 인-프로세스 백엔드를 우선 사용하고,
+        백엔드를 import할 수 없을 때 pyhwp CLI(hwp5html, hwp5odt)로
+        폴백한다. 어느 경로든 실패 시 명확한 예외를 전달해야 한다.
 
     테스트 전략:
-        subprocess.run을 mocking하여 실패 시나리오를 재현한다.
-        실제 pyhwp CLI 실패은 재현하기 어려우므로 mocking 사용.
+        CLI 폴백 경로는 백엔드를 비활성화한 뒤 subprocess.run을
+        mocking하여 재현한다. 인-프로세스 경로는 백엔드 함수가
+        예외를 던지도록 mocking한다.
 
     관련 테스트:
         - TestFileValidation: 입력 파일 검증
     """
 
+    @pytest.fixture(autouse=True)
+    def _force_cli_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """pyhwp 인-프로세스 백엔드 비활성화 → CLI 폴백 경로 검증."""
+        from hwp_parser.core import converter as converter_module
+
+        monkeypatch.setattr(converter_module, "_PYHWP_BACKEND_TRIED", True)
+        monkeypatch.setattr(converter_module, "_pyhwp_backend", None)
+
     def test_to_html_subprocess_failure(self, tmp_path: Path) -> None:
         """hwp5html 실패 → RuntimeError.
 
@@ -783,12 +1213,107 @@ class TestConverterErrorPaths:
         finally:
             subprocess.run = original_run  # type: ignore[assignment]
 
+    def test_to_html_backend_error_wrapped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """인-프로세스 백엔드 실패 → RuntimeError 래핑.
+
+        Given: 백엔드 convert_to_html_dir이 예외 발생
+        When: to_html 호출
+        Then: RuntimeError("HTML 변환 실패")로 래핑되어 전달
+        """
+        from hwp_parser.core import converter as converter_module
+
+        hwp_file = tmp_path / "sample.hwp"
+        hwp_file.write_bytes(b"dummy")
+
+        class _FakeBackend:
+            @staticmethod
+            def convert_to_html_dir(*_args: object) -> None:
+                raise ValueError("파싱 오류")
+
+        monkeypatch.setattr(converter_module, "_pyhwp_backend", _FakeBackend)
+
+        converter = HWPConverter()
+        with pytest.raises(RuntimeError, match="HTML 변환 실패"):
+            converter.to_html(hwp_file)
+
+    def test_to_odt_backend_error_wrapped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """인-프로세스 백엔드 ODT 실패 → RuntimeError 래핑.
+
+        Given: 백엔드 convert_to_odt가 예외 발생
+        When: to_odt 호출
+        Then: RuntimeError("ODT 변환 실패")로 래핑되어 전달
+        """
+        from hwp_parser.core import converter as converter_module
+
+        hwp_file = tmp_path / "sample.hwp"
+        hwp_file.write_bytes(b"dummy")
+
+        class _FakeBackend:
+            @staticmethod
+            def convert_to_odt(*_args: object) -> None:
+                raise ValueError("파싱 오류")
+
+        monkeypatch.setattr(converter_module, "_pyhwp_backend", _FakeBackend)
+
+        converter = HWPConverter()
+        with pytest.raises(RuntimeError, match="ODT 변환 실패"):
+            converter.to_odt(hwp_file)
+
+
+class TestScratchRoot:
+    """스크래치 루트 선택 테스트 스위트.
+
+    테스트 대상:
+        - converter 모듈의 _scratch_root() 함수
+
+    검증 범위:
+        1. HWPPARSER_SCRATCH_DIR 환경 변수 우선
+        2. 기본값은 /dev/shm 또는 None (tempfile 기본 경로)
+    """
+
+    def test_env_override_wins(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """환경 변수 설정 시 해당 경로 반환.
+
+        Given: HWPPARSER_SCRATCH_DIR=tmp_path
+        When: _scratch_root() 호출
+        Then: tmp_path 반환
+        """
+        from hwp_parser.core.converter import _scratch_root
+
+        monkeypatch.setenv("HWPPARSER_SCRATCH_DIR", str(tmp_path))
+        assert _scratch_root() == str(tmp_path)
+
+    def test_default_is_shm_or_none(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """환경 변수 없으면 /dev/shm 또는 None 반환.
+
+        Given: HWPPARSER_SCRATCH_DIR 미설정
+        When: _scratch_root() 호출
+        Then: /dev/shm (쓰기 가능 시) 또는 None
+        """
+        import os
+
+        from hwp_parser.core.converter import _scratch_root
+
+        monkeypatch.delenv("HWPPARSER_SCRATCH_DIR", raising=False)
+        expected = (
+            "/dev/shm"
+            if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+            else None
+        )
+        assert _scratch_root() == expected
+
 
 class TestConverterLogging:
     """로깅 초기화 경로 테스트 스위트.
 
     테스트 대상:
-        - HWPConverter._configure_logger() 클래스 메서드
+        - converter 모듈의 _configure_logger() 함수
         - HWPConverter._log_start(), _log_finish() 메서드
 
     검증 범위:
@@ -798,31 +1323,35 @@ class TestConverterLogging:
 
     비즈니스 컨텍스트:
         loguru를 사용한 로깅은 디버깅 목적이다.
-        _logger_configured 플래그로 중복 설정을 방지한다.
+        모듈 전역 _LOGGER_CONFIGURED 센티널로 중복 설정을 방지한다.
     """
 
     def test_verbose_configures_logger(self) -> None:
         """verbose=True → 로거 설정.
 
-        Given: _logger_configured=False
+        Given: _LOGGER_CONFIGURED=False
         When: HWPConverter(verbose=True) 생성
-        Then: _logger_configured=True
+        Then: _LOGGER_CONFIGURED=True
         """
-        HWPConverter._logger_configured = False
+        from hwp_parser.core import converter as converter_module
+
+        converter_module._LOGGER_CONFIGURED = False
         converter = HWPConverter(verbose=True)
         assert converter.verbose is True
-        assert HWPConverter._logger_configured is True
+        assert converter_module._LOGGER_CONFIGURED is True
 
     def test_configure_logger_idempotent(self) -> None:
         """로거 재설정 → 조기 반환.
 
-        Given: _logger_configured=True
+        Given: _LOGGER_CONFIGURED=True
         When: _configure_logger() 재호출
         Then: 플래그 유지 (중복 설정 방지)
         """
-        HWPConverter._logger_configured = True
-        HWPConverter._configure_logger()
-        assert HWPConverter._logger_configured is True
+        from hwp_parser.core import converter as converter_module
+
+        converter_module._LOGGER_CONFIGURED = True
+        converter_module._configure_logger()
+        assert converter_module._LOGGER_CONFIGURED is True
 
     def test_log_start_with_missing_file(self, tmp_path: Path) -> None:
         """존재하지 않는 파일 로깅 → 정상 처리.
@@ -21,6 +21,9 @@ from hwp_parser.core.worker import (
     _convert_to_odt,
     _html_to_markdown,
     _html_to_text,
+    _make_html_result,
+    _remove_dir_fast,
+    unpack_html_result,
     worker_main,
 )
 
@@ -81,38 +84,28 @@ class TestHtmlConversion:
 
     def test_convert_to_html_dir_returns_tuple(self, sample_hwp_file: Path) -> None:
         """_convert_to_html_dir이 (xhtml, css, bindata) 튜플을 반환하는지 검증."""
-        temp_dir = Path(tempfile.mkdtemp())
-        try:
-            result = _convert_to_html_dir(sample_hwp_file, temp_dir)
-            assert isinstance(result, tuple)
-            assert len(result) == 3
-
-            xhtml, css, bindata = result
-            assert isinstance(xhtml, str)
-            assert len(xhtml) > 0
-            assert "html" in xhtml.lower() or "xhtml" in xhtml.lower()
-            assert isinstance(css, str)
-            assert isinstance(bindata, dict)
-        finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-
-    def test_convert_to_html_dir_missing_output_raises(
+        result = _convert_to_html_dir(sample_hwp_file)
+        assert isinstance(result, tuple)
+        assert len(result) == 3
+
+        xhtml, css, bindata = result
+        assert isinstance(xhtml, str)
+        assert len(xhtml) > 0
+        assert "html" in xhtml.lower() or "xhtml" in xhtml.lower()
+        assert isinstance(css, str)
+        assert isinstance(bindata, dict)
+
+    def test_convert_to_html_dir_empty_output_raises(
         self, sample_hwp_file: Path
     ) -> None:
-        """HTML 변환 후 결과 파일이 없으면 RuntimeError 발생 검증."""
-        temp_dir = Path(tempfile.mkdtemp())
-        try:
-            # HTMLTransform.transform_hwp5_to_dir을 mock하여 파일 생성 안 함
-            with patch("hwp_parser.core.worker.HTMLTransform") as mock_transform:
-                mock_instance = MagicMock()
-                mock_transform.return_value = mock_instance
+        """HTML 변환 결과가 비어 있으면 RuntimeError 발생 검증."""
+        # HTMLTransform을 mock하여 XHTML 버퍼가 비어 있게 함
+        with patch("hwp_parser.core._pyhwp_backend.HTMLTransform") as mock_transform:
+            mock_instance = MagicMock()
+            mock_transform.return_value = mock_instance
 
-                with pytest.raises(RuntimeError, match="결과 파일이 생성되지 않음"):
-                    _convert_to_html_dir(sample_hwp_file, temp_dir)
-        finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            with pytest.raises(RuntimeError, match="변환 결과가 비어 있음"):
+                _convert_to_html_dir(sample_hwp_file)
 
 
 class TestHtmlConversionWithBinData:
@@ -149,19 +142,54 @@ class TestHtmlConversionWithBinData:
         self, hwp_file_with_bindata: Path
     ) -> None:
         """bindata가 포함된 HWP 변환 시 bindata dict가 채워지는지 검증."""
-        temp_dir = Path(tempfile.mkdtemp())
-        try:
-            xhtml, css, bindata = _convert_to_html_dir(hwp_file_with_bindata, temp_dir)
-            # bindata가 있을 수도 있고 없을 수도 있음 (파일에 따라)
-            # 하지만 dict 타입이어야 함
-            assert isinstance(bindata, dict)
-            # bindata가 있으면 bytes 값이어야 함
-            for name, data in bindata.items():
-                assert isinstance(name, str)
-                assert isinstance(data, bytes)
-        finally:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+        xhtml, css, bindata = _convert_to_html_dir(hwp_file_with_bindata)
+        # bindata가 있을 수도 있고 없을 수도 있음 (파일에 따라)
+        # 하지만 dict 타입이어야 함
+        assert isinstance(bindata, dict)
+        # bindata가 있으면 bytes 값이어야 함
+        for name, data in bindata.items():
+            assert isinstance(name, str)
+            assert isinstance(data, bytes)
+
+
+class TestSharedMemoryHandoff:
+    """HTML 결과 공유 메모리 전달 테스트.
+
+    테스트 대상:
+        - _make_html_result, unpack_html_result 함수
+
+    검증 범위:
+        1. 임계값 미만 결과는 Queue 인라인 전달
+        2. 임계값 이상 결과는 공유 메모리 왕복 후 원본과 동일
+    """
+
+    def test_small_result_stays_inline(self) -> None:
+        """작은 결과는 공유 메모리 없이 인라인으로 전달되는지 검증."""
+        result = _make_html_result(1, "<html/>", "body{}", {})
+        assert result.success is True
+        assert result.shm_name is None
+        assert result.content == "<html/>"
+        assert result.css_content == "body{}"
+        assert result.bindata == {}
+
+    def test_large_result_roundtrips_via_shm(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """임계값 이상 결과가 공유 메모리로 왕복되는지 검증."""
+        from hwp_parser.core import worker as worker_module
+
+        monkeypatch.setattr(worker_module, "_SHM_MIN_BYTES", 0)
+
+        bindata = {"img1.png": b"\x89PNG\r\n", "img2.jpg": b"\xff\xd8\xff"}
+        result = _make_html_result(7, "<html>한글</html>", "p{}", bindata)
+
+        assert result.shm_name is not None
+        assert result.content is None  # 페이로드는 세그먼트에만 존재
+
+        xhtml, css, restored = unpack_html_result(result)
+        assert xhtml == "<html>한글</html>"
+        assert css == "p{}"
+        assert restored == bindata
 
 
 class TestOdtConversion:
@@ -197,16 +225,19 @@ class TestOdtConversion:
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
-    def test_convert_to_odt_command_failure_raises(self, sample_hwp_file: Path) -> None:
-        """hwp5odt 명령 실패 시 RuntimeError 발생 검증."""
+    def test_convert_to_odt_transform_failure_raises(
+        self, sample_hwp_file: Path
+    ) -> None:
+        """ODT 변환 실패 시 RuntimeError 발생 검증."""
         temp_dir = Path(tempfile.mkdtemp())
         try:
-            mock_result = MagicMock()
-            mock_result.returncode = 1
-            mock_result.stderr = "변환 오류"
+            mock_transform = MagicMock()
+            mock_transform.return_value.transform_hwp5_to_package.side_effect = (
+                Exception("변환 오류")
+            )
 
             with patch(
-                "hwp_parser.core.worker.subprocess.run", return_value=mock_result
+                "hwp_parser.core._pyhwp_backend.ODTTransform", mock_transform
             ):
                 with pytest.raises(RuntimeError, match="ODT 변환 실패"):
                     _convert_to_odt(sample_hwp_file, temp_dir)
@@ -218,11 +249,9 @@ class TestOdtConversion:
         """ODT 변환 후 결과 파일이 없으면 RuntimeError 발생 검증."""
         temp_dir = Path(tempfile.mkdtemp())
         try:
-            mock_result = MagicMock()
-            mock_result.returncode = 0  # 성공했지만 파일은 없음
-
-            with patch(
-                "hwp_parser.core.worker.subprocess.run", return_value=mock_result
+            # 변환과 패키지 생성 모두 no-op으로 mock → 결과 파일 미생성
+            with patch("hwp_parser.core._pyhwp_backend.ODTTransform"), patch(
+                "hwp_parser.core._pyhwp_backend.ODTPackage"
             ):
                 with pytest.raises(RuntimeError, match="결과 파일이 생성되지 않음"):
                     _convert_to_odt(sample_hwp_file, temp_dir)
@@ -231,6 +260,29 @@ class TestOdtConversion:
                 shutil.rmtree(temp_dir)
 
 
+class TestScratchCleanup:
+    """스크래치 디렉터리 정리 함수 테스트.
+
+    테스트 대상:
+        - _remove_dir_fast 함수
+
+    검증 범위:
+        1. 중첩 디렉터리/파일 재귀 삭제
+    """
+
+    def test_remove_dir_fast_removes_nested_tree(self, tmp_path: Path) -> None:
+        """중첩된 디렉터리 트리가 완전히 삭제되는지 검증."""
+        root = tmp_path / "scratch"
+        (root / "sub" / "subsub").mkdir(parents=True)
+        (root / "a.txt").write_text("a")
+        (root / "sub" / "b.bin").write_bytes(b"b")
+        (root / "sub" / "subsub" / "c.odt").write_bytes(b"c")
+
+        _remove_dir_fast(root)
+
+        assert not root.exists()
+
+
 class TestTextConversion:
     """텍스트 변환 함수 테스트.
 
@@ -311,12 +363,13 @@ class TestWorkerMain:
         thread.start()
         thread.join(timeout=30)
 
-        # 결과 확인
+        # 결과 확인 (큰 결과는 공유 메모리로 전달될 수 있음)
         result: WorkerResult = output_queue.get(timeout=5)
         assert result.task_id == 1
         assert result.success is True
-        assert isinstance(result.content, str)
-        assert len(result.content) > 0
+        xhtml, _, _ = unpack_html_result(result)
+        assert isinstance(xhtml, str)
+        assert len(xhtml) > 0
 
     def test_worker_main_text_conversion(self, sample_hwp_file: Path) -> None:
         """worker_main이 텍스트 변환을 수행하는지 검증."""